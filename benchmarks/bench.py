@@ -0,0 +1,220 @@
+"""Microbenchmarks for the core hot paths.
+
+Usage:
+    python benchmarks/bench.py [-o results.json] [--baseline old.json] [--threshold 10]
+    python benchmarks/bench.py --compare old.json new.json [--threshold 10]
+
+Each case reports the best nanoseconds per operation over several repeats.
+With ``--baseline`` or ``--compare``, cases slower than the baseline by more
+than ``--threshold`` percent are flagged and the exit status is 1.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "q-rpg"
+for path in (SRC / "status", SRC / "overseer", SRC):
+    sys.path.insert(0, str(path))
+
+from items import BaseItem  # noqa: E402
+from role.base import Character, CharacterAttributes  # noqa: E402
+from status import Buff, Debuff, EffectPool, StatusArgs, StatusEffect, VirtualClock  # noqa: E402
+
+# Health high enough that nothing dies mid-benchmark
+SPONGE = 10 ** 15
+
+
+def dummy(name: str = "Dummy") -> Character:
+    character = Character(CharacterAttributes(name, "Warrior", 100, 25, 50, 15, 10))
+    character.health = SPONGE
+    return character
+
+
+def case_construct():
+    sheet = CharacterAttributes("Template", "Warrior")
+
+    def op():
+        Character(CharacterAttributes("Npc", "Warrior", 100, 25, 25, 25, 25))
+        Character(sheet)
+
+    return op
+
+
+def case_attack():
+    attacker, target = dummy("Attacker"), dummy("Target")
+    return lambda: attacker.attack(target)
+
+
+def case_level_up():
+    character = dummy()
+
+    def op():
+        character.exp = character._exp_to_next_level
+
+    return op
+
+
+def case_gain_exp():
+    character = dummy()
+    return lambda: character.gain_exp(12_345)
+
+
+def case_effect_apply():
+    clock = VirtualClock()
+    target = dummy()
+    args = StatusArgs.POISONED.value
+    return lambda: StatusEffect(*args, clock=clock).apply(target)
+
+
+def case_effect_recycled():
+    clock = VirtualClock()
+    target = dummy()
+    pool = EffectPool()
+
+    def op():
+        effect = pool.acquire(StatusArgs.POISONED, clock)
+        effect.apply(target)
+        pool.release(effect)
+
+    return op
+
+
+def _modifier(kind):
+    clock = VirtualClock()
+    target = dummy()
+    modifier = kind("strength", 10 ** 12, 1, clock)
+    modifier.start(target)
+    return lambda: modifier.apply(target)
+
+
+def case_buff_apply():
+    return _modifier(Buff)
+
+
+def case_debuff_apply():
+    return _modifier(Debuff)
+
+
+def case_item_quantity():
+    item = BaseItem("Potion", 10, 25, "health")
+
+    def op():
+        item.count += 2
+        item + 1
+        item.count = len(item) - 3
+
+    return op
+
+
+CASES = {
+    "construct": case_construct,
+    "attack": case_attack,
+    "level_up": case_level_up,
+    "gain_exp": case_gain_exp,
+    "effect_apply": case_effect_apply,
+    "effect_recycled": case_effect_recycled,
+    "buff_apply": case_buff_apply,
+    "debuff_apply": case_debuff_apply,
+    "item_quantity": case_item_quantity,
+}
+
+
+def measure(op, number: int, repeat: int) -> list[float]:
+    timings = []
+    # Like timeit, keep collector pauses out of the numbers
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter_ns()
+            for _ in range(number):
+                op()
+            timings.append((time.perf_counter_ns() - started) / number)
+    finally:
+        if enabled:
+            gc.enable()
+    return timings
+
+
+def commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SRC, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names: list[str], number: int, repeat: int) -> dict:
+    results = {}
+    for name in names:
+        timings = measure(CASES[name](), number, repeat)
+        timings.sort()
+        results[name] = {
+            "ns_per_op": round(timings[0], 1),
+            "median_ns": round(timings[len(timings) // 2], 1),
+            "number": number,
+            "repeat": repeat,
+        }
+        print(f"{name:<16}{timings[0]:>12.1f} ns/op", file=sys.stderr)
+    return {
+        "meta": {
+            "commit": commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> bool:
+    """Print the change for every shared case, returns True when any slowed past ``threshold`` percent."""
+    regressed = False
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        change = 100 * (result["ns_per_op"] / before["ns_per_op"] - 1)
+        flag = change > threshold
+        regressed |= flag
+        print(
+            f"{name:<16}{before['ns_per_op']:>12.1f}{result['ns_per_op']:>12.1f}{change:>+9.1f}%"
+            f"{'  SLOWER' if flag else ''}"
+        )
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare this run against earlier results")
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("OLD", "NEW"), help="compare two results files")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown to flag")
+    parser.add_argument("-k", "--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("-n", "--number", type=int, default=20_000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.compare:
+        old, new = (json.loads(path.read_text()) for path in args.compare)
+        sys.exit(1 if compare(old, new, args.threshold) else 0)
+
+    results = run(args.cases, args.number, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+    if args.baseline:
+        sys.exit(1 if compare(json.loads(args.baseline.read_text()), results, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Load test the game server with many clients over localhost or a Unix socket.
+
+Usage: python benchmarks/load_server.py [--sessions N] [--characters N] [--clients N]
+                                        [--rate HZ] [--attacks N] [--duration S] [--unix PATH]
+
+Starts a ``GameServer`` in a child process with ``--sessions`` battles of
+``--characters`` each, then connects ``--clients`` clients spread over the
+sessions. After every delta a client queues ``--attacks`` random attacks and,
+now and then, a status effect. Reports the tick rate clients observed, p50 and
+p99 latency from a tick starting to its delta arriving, the server's p99 tick
+time and delta sizes.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+SRC = Path(__file__).resolve().parent.parent / "q-rpg"
+for path in (SRC / "status", SRC / "overseer", SRC):
+    sys.path.insert(0, str(path))
+
+from overseer import sheet_index  # noqa: E402
+from role.pool import CharacterPool  # noqa: E402
+from server import GameClient, GameServer  # noqa: E402
+from status import StatusArgs  # noqa: E402
+
+
+def serve(args, ready) -> None:
+    async def run():
+        server = GameServer(rate=args.rate)
+        rng = np.random.default_rng(0)
+        for _ in range(args.sessions):
+            pool = CharacterPool(args.characters)
+            pool.spawn([""] * args.characters, "", sheet_index().sample(args.characters, rng))
+            server.add_session(pool)
+        address = await server.start(port=0, path=args.unix)
+        ready.put(address)
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+async def play(args, address, number: int, stop: float) -> GameClient:
+    client = GameClient()
+    if args.unix:
+        await client.connect(path=args.unix)
+    else:
+        await client.connect(port=address[1])
+    await client.join(number % args.sessions)
+    rng = np.random.default_rng(number)
+    effects = tuple(StatusArgs)
+    while time.perf_counter() < stop:
+        await client.receive()
+        for attacker, target in rng.integers(0, args.characters, (args.attacks, 2)).tolist():
+            client.attack(attacker, target)
+        if rng.random() < 0.1:
+            client.effect(int(rng.integers(args.characters)), effects[rng.integers(len(effects))])
+        await client.drain()
+    await client.close()
+    return client
+
+
+async def load(args, address) -> list[GameClient]:
+    stop = time.perf_counter() + args.duration
+    return await asyncio.gather(*(play(args, address, number, stop) for number in range(args.clients)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--characters", type=int, default=2_000)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--attacks", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--unix", default=None, help="serve on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args, ready), daemon=True)
+    server.start()
+    try:
+        address = ready.get(timeout=30)
+        started = time.perf_counter()
+        clients = asyncio.run(load(args, address))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+
+    latencies = np.concatenate([client.latencies for client in clients]) * 1e3
+    work = np.concatenate([client.work for client in clients]) / 1e3
+    deltas = sum(len(client.latencies) for client in clients)
+    received = sum(client.received for client in clients)
+    print(f"{args.clients} clients on {args.sessions} sessions of {args.characters} characters at {args.rate:g} Hz")
+    print(f"ticks/sec:        {deltas / args.clients / elapsed:.1f}")
+    print(f"latency p50/p99:  {np.percentile(latencies, 50):.2f} / {np.percentile(latencies, 99):.2f} ms")
+    print(f"server tick p99:  {np.percentile(work, 99):.2f} ms")
+    print(f"deltas:           {deltas} averaging {received / max(deltas, 1) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
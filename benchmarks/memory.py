@@ -0,0 +1,66 @@
+"""Measure bytes per instance of the core objects.
+
+Usage: python benchmarks/memory.py [--src PATH] [-n COUNT]
+
+Point ``--src`` at another checkout's ``q-rpg`` directory to compare layouts.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "q-rpg"
+
+
+def add_source(src: Path) -> None:
+    for path in (src / "items", src / "role", src / "status", src / "overseer", src):
+        sys.path.insert(0, str(path))
+
+
+def per_instance(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    total = sum(stat.size_diff for stat in stats)
+    # Don't charge the list holding the objects to the objects themselves
+    total -= sys.getsizeof(objects)
+    return total / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--src", type=Path, default=SRC)
+    parser.add_argument("-n", "--count", type=int, default=100_000)
+    args = parser.parse_args()
+    add_source(args.src.resolve())
+
+    from role.base import Character, CharacterAttributes
+    from role.pool import CharacterPool
+    from status import StatusArgs, StatusEffect, Buff, Debuff
+    import items.base
+
+    sheet = CharacterAttributes("Template", "Warrior")
+    pool = CharacterPool(1)
+    pool.add(sheet)
+    factories = {
+        "CharacterAttributes": lambda i: CharacterAttributes("Npc", "Warrior"),
+        "Character": lambda i: Character(sheet),
+        "CharacterView": lambda i: pool[0],
+        "StatusEffect": lambda i: StatusEffect(*StatusArgs.POISONED.value),
+        "Buff": lambda i: Buff("strength", 5, 2),
+        "Debuff": lambda i: Debuff("agility", 5, 2),
+        "BaseItem": lambda i: items.base.BaseItem("Potion", 10, 25, "health"),
+    }
+    print(f"{'class':<22}{'bytes/instance':>16}")
+    for name, factory in factories.items():
+        print(f"{name:<22}{per_instance(factory, args.count):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Stress concurrent stat mutation from many effect threads.
+
+Usage: python benchmarks/stress_mutation.py [--threads N] [--effects N] [--unsafe]
+
+Every thread ticks poison effects against a handful of shared characters, so
+most ticks contend for the same character. The run reports lost updates,
+health ticks that never landed, and dead characters that were revived by a
+late status write. ``--unsafe`` ticks through the bare ``health`` property
+for comparison. Exits non-zero if anything was lost.
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "q-rpg"
+for path in (SRC / "status", SRC / "overseer", SRC):
+    sys.path.insert(0, str(path))
+
+from role.base import Character, CharacterAttributes  # noqa: E402
+from status import Status, StatusEffect, VirtualClock  # noqa: E402
+
+
+class UnsafePoison(StatusEffect):
+    __slots__ = ()
+
+    def tick(self, target: Character) -> bool:
+        if self._duration <= 0:
+            return False
+        target.health -= self.value_over_time
+        self._duration -= 1
+        return True
+
+
+def lost_updates(args) -> int:
+    characters = [Character(CharacterAttributes(f"Target {i}", "Dummy")) for i in range(args.characters)]
+    start = 10 ** 9
+    for character in characters:
+        character.health = start
+    effect = UnsafePoison if args.unsafe else StatusEffect
+    ticks = [0] * len(characters)
+    barrier = threading.Barrier(args.threads)
+
+    def work(seed: int) -> None:
+        rng = random.Random(seed)
+        picks = [rng.randrange(len(characters)) for _ in range(args.effects)]
+        barrier.wait()
+        for index in picks:
+            effect("Poisoned", "health", args.duration, 1, VirtualClock()).apply(characters[index])
+
+    seeds = range(args.threads)
+    for seed in seeds:
+        for index in (random.Random(seed).randrange(len(characters)) for _ in range(args.effects)):
+            ticks[index] += args.duration
+    run(work, seeds)
+    return sum(character.health - (start - expected) for character, expected in zip(characters, ticks))
+
+
+def revived(args) -> int:
+    characters = [Character(CharacterAttributes(f"Target {i}", "Dummy")) for i in range(args.characters * 50)]
+    barrier = threading.Barrier(args.threads)
+
+    def work(seed: int) -> None:
+        barrier.wait()
+        if seed == 0:
+            for character in characters:
+                character.defend(10 ** 6)
+        else:
+            for character in characters:
+                StatusEffect("Poisoned", "health", 1, 0, VirtualClock()).apply(character)
+
+    run(work, range(args.threads))
+    return sum(character.status != Status.DEAD for character in characters)
+
+
+def run(work, seeds) -> None:
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in seeds]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--effects", type=int, default=2_000)
+    parser.add_argument("--duration", type=int, default=5)
+    parser.add_argument("--characters", type=int, default=4)
+    parser.add_argument("--unsafe", action="store_true")
+    args = parser.parse_args()
+    # Switch threads as often as possible to provoke interleaving
+    sys.setswitchinterval(1e-6)
+
+    started = time.perf_counter()
+    lost = lost_updates(args)
+    dead = revived(args) if not args.unsafe else 0
+    elapsed = time.perf_counter() - started
+    ticks = args.threads * args.effects * args.duration
+    print(f"{ticks} ticks on {args.characters} characters from {args.threads} threads in {elapsed:.2f}s")
+    print(f"lost updates: {lost}")
+    print(f"revived characters: {dead}")
+    sys.exit(1 if lost or dead else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,7 @@
 """Author: Burhan Qaddoumi - github.com/Burhan-Q"""
+
+from items.base import BaseItem
+from items.catalog import ItemDefinition, ItemCatalog, default_catalog
+from items.inventory import Inventory, CompactInventory
+
+__all__ = "BaseItem", "ItemDefinition", "ItemCatalog", "default_catalog", "Inventory", "CompactInventory"
@@ -2,6 +2,8 @@
 
 
 class BaseItem:
+    __slots__ = ("_name", "_cost", "_value", "_effect", "_quantity")
+
     def __init__(self, name:str, cost:int, value:int, effect:str) -> None:
         self._name = name
         self._cost = cost
@@ -43,7 +45,7 @@ class BaseItem:
         return self._quantity
     
     def __repr__(self) -> str:
-        return f"{self.name} {self.type}: {self._quantity}"
+        return f"{self.name} {self.effect}: {self._quantity}"
 
     def use(self):
         raise NotImplementedError
@@ -0,0 +1,101 @@
+"""Shared, immutable item definitions."""
+
+from items.base import BaseItem
+
+
+class ItemDefinition:
+    __slots__ = ("_id", "_name", "_cost", "_value", "_effect")
+
+    def __init__(self, id: int, name: str, cost: int, value: int, effect: str) -> None:
+        self._id = id
+        self._name = name
+        self._cost = cost
+        self._value = value
+        self._effect = effect
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def cost(self) -> int:
+        return self._cost
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @property
+    def effect(self) -> str:
+        return self._effect
+
+    def create(self, quantity: int = 1) -> BaseItem:
+        item = BaseItem(self._name, self._cost, self._value, self._effect)
+        item.count = quantity
+        return item
+
+    def __repr__(self) -> str:
+        return f"#{self.id} {self.name} +++ Cost:{self.cost} +++ Value:{self.value} +++ Effect:{self.effect}"
+
+
+class ItemCatalog:
+    """Interns one ``ItemDefinition`` per item name, addressable by name or id."""
+
+    __slots__ = ("_definitions", "_by_name")
+
+    def __init__(self) -> None:
+        self._definitions: list[ItemDefinition] = []
+        self._by_name: dict[str, ItemDefinition] = {}
+
+    def define(self, name: str, cost: int, value: int, effect: str) -> ItemDefinition:
+        definition = self._by_name.get(name)
+        if definition is None:
+            definition = ItemDefinition(len(self._definitions), name, cost, value, effect)
+            self._definitions.append(definition)
+            self._by_name[name] = definition
+        else:
+            assert (definition.cost, definition.value, definition.effect) == (cost, value, effect), \
+                f"{name} is already defined differently"
+        return definition
+
+    def intern(self, item: BaseItem) -> ItemDefinition:
+        return self.define(item.name, item.cost, item.value, item.effect)
+
+    def load(self, rows) -> list[ItemDefinition]:
+        """Define many items from ``(name, cost, value, effect)`` rows."""
+        return [self.define(*row) for row in rows]
+
+    def get(self, name: str) -> ItemDefinition | None:
+        return self._by_name.get(name)
+
+    def by_name(self, name: str) -> ItemDefinition:
+        return self._by_name[name]
+
+    def by_id(self, id: int) -> ItemDefinition:
+        return self._definitions[id]
+
+    def __getitem__(self, key: int | str) -> ItemDefinition:
+        return self._definitions[key] if isinstance(key, int) else self._by_name[key]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self._definitions)
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+
+_default = None
+
+
+def default_catalog() -> ItemCatalog:
+    global _default
+    if _default is None:
+        _default = ItemCatalog()
+    return _default
@@ -0,0 +1,158 @@
+"""Item containers for characters."""
+
+from items.base import BaseItem
+from items.catalog import ItemCatalog, default_catalog
+
+
+class Inventory:
+    """Stacks of items indexed by name and by effect.
+
+    ``capacity`` caps the number of distinct stacks and ``stack_limit`` the
+    quantity of any one stack, ``None`` leaves either unbounded.
+    """
+
+    __slots__ = ("_capacity", "_stack_limit", "_items", "_by_effect")
+
+    def __init__(self, capacity: int = None, stack_limit: int = None) -> None:
+        self._capacity = capacity
+        self._stack_limit = stack_limit
+        self._items: dict[str, BaseItem] = {}
+        # Dicts double as ordered sets of item names
+        self._by_effect: dict[str, dict[str, None]] = {}
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def stack_limit(self) -> int:
+        return self._stack_limit
+
+    @property
+    def full(self) -> bool:
+        return self._capacity is not None and len(self) >= self._capacity
+
+    @property
+    def total(self) -> int:
+        return sum(self.count(name) for name in self.names())
+
+    def names(self) -> list[str]:
+        return list(self._items)
+
+    def get(self, name: str) -> BaseItem | None:
+        return self._items.get(name)
+
+    def count(self, name: str) -> int:
+        item = self._items.get(name)
+        return 0 if item is None else item.count
+
+    def with_effect(self, effect: str) -> list[BaseItem]:
+        return [self.get(name) for name in self._by_effect.get(effect.lower(), ())]
+
+    def add(self, item: BaseItem, amount: int = None) -> int:
+        """Stack ``amount`` of ``item`` (default its own count), returns how many fit."""
+        amount = item.count if amount is None else amount
+        held = self.count(item.name)
+        if not held and self.full:
+            return 0
+        if self._stack_limit is not None:
+            amount = min(amount, self._stack_limit - held)
+        if amount <= 0:
+            return 0
+        if held:
+            self._grow(item.name, amount)
+        else:
+            self._insert(item, amount)
+            self._by_effect.setdefault(item.effect.lower(), {})[item.name] = None
+        return amount
+
+    def remove(self, name: str, amount: int = 1) -> int:
+        """Unstack up to ``amount`` of ``name``, returns how many were removed."""
+        held = self.count(name)
+        amount = min(amount, held)
+        if amount <= 0:
+            return 0
+        if amount == held:
+            effect = self._pop(name).lower()
+            named = self._by_effect[effect]
+            del named[name]
+            if not named:
+                del self._by_effect[effect]
+        else:
+            self._grow(name, -amount)
+        return amount
+
+    def _insert(self, item: BaseItem, amount: int) -> None:
+        # A stack of our own, so neither side's counts move under the other
+        stack = BaseItem(item.name, item.cost, item.value, item.effect)
+        stack.count = amount
+        self._items[item.name] = stack
+
+    def _grow(self, name: str, amount: int) -> None:
+        self._items[name] + amount
+
+    def _pop(self, name: str) -> str:
+        return self._items.pop(name).effect
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._items
+
+    def __iter__(self):
+        return (self.get(name) for name in self.names())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}: {self.count(name)}' for name in self.names())})"
+
+
+class CompactInventory(Inventory):
+    """``Inventory`` holding only catalog ids and quantities.
+
+    Item definitions are shared through an ``ItemCatalog``, so memory grows
+    with the number of stacks rather than item objects. ``get`` hands back a
+    fresh ``BaseItem``, change quantities through ``add``/``remove``.
+    """
+
+    __slots__ = ("_catalog",)
+
+    def __init__(self, capacity: int = None, stack_limit: int = None, catalog: ItemCatalog = None) -> None:
+        super().__init__(capacity, stack_limit)
+        self._catalog = default_catalog() if catalog is None else catalog
+        # Catalog id -> quantity
+        self._items: dict[int, int] = {}
+
+    @property
+    def catalog(self) -> ItemCatalog:
+        return self._catalog
+
+    @property
+    def total(self) -> int:
+        return sum(self._items.values())
+
+    def names(self) -> list[str]:
+        by_id = self._catalog.by_id
+        return [by_id(id).name for id in self._items]
+
+    def get(self, name: str) -> BaseItem | None:
+        quantity = self.count(name)
+        return self._catalog.by_name(name).create(quantity) if quantity else None
+
+    def count(self, name: str) -> int:
+        definition = self._catalog.get(name)
+        return 0 if definition is None else self._items.get(definition.id, 0)
+
+    def _insert(self, item: BaseItem, amount: int) -> None:
+        self._items[self._catalog.intern(item).id] = amount
+
+    def _grow(self, name: str, amount: int) -> None:
+        self._items[self._catalog.by_name(name).id] += amount
+
+    def _pop(self, name: str) -> str:
+        definition = self._catalog.by_name(name)
+        del self._items[definition.id]
+        return definition.effect
+
+    def __contains__(self, name: str) -> bool:
+        return self.count(name) > 0
@@ -0,0 +1,6 @@
+"""Author: Burhan Qaddoumi - github.com/Burhan-Q"""
+
+from journal.log import EventLogWriter, EventLogReader, replay
+from journal.metrics import Metrics, metrics
+
+__all__ = "EventLogWriter", "EventLogReader", "replay", "Metrics", "metrics"
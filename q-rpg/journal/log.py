@@ -0,0 +1,177 @@
+"""Append-only binary log of game events, with streaming read back and replay.
+
+A log is a short header followed by fixed-width little-endian records::
+
+    kind, aux, actor row, target row, value, wall time
+
+Actors and targets are recorded by their row in the roster handed to the
+writer, ``NOBODY`` when they are not part of it.
+"""
+
+import os
+import struct
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from overseer import Event, Stat, subscribe, unsubscribe
+from role.pool import CharacterPool, CharacterView, STATUSES
+
+MAGIC = b"QLOG"
+VERSION = 1
+HEADER = struct.Struct("<4sHxx")
+
+RECORD = np.dtype([
+    ("kind", "u1"),
+    ("aux", "u1"),
+    ("actor", "<u4"),
+    ("target", "<u4"),
+    ("value", "<i8"),
+    ("time", "<f8"),
+])
+
+NOBODY = 0xFFFFFFFF
+
+
+class EventLogWriter:
+    """Records every emitted event for ``roster`` (a list of Characters or a CharacterPool).
+
+    The listener only queues the event; a background thread packs and appends
+    queued events every ``interval`` seconds, or sooner once ``batch`` are waiting.
+    """
+
+    def __init__(self, path, roster, batch: int = 4096, interval: float = 0.5) -> None:
+        self._pool = roster if isinstance(roster, CharacterPool) else None
+        self._rows = {} if self._pool is not None else {character: row for row, character in enumerate(roster)}
+        self._batch = batch
+        self._interval = interval
+        self._queue = deque()
+        # Held while draining, ``flush`` may race the background thread
+        self._flushing = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        fresh = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "ab")
+        if fresh:
+            self._file.write(HEADER.pack(MAGIC, VERSION))
+        else:
+            with open(path, "rb") as existing:
+                _check_header(existing, path)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "EventLogWriter":
+        subscribe(self)
+        self._thread.start()
+        return self
+
+    def __call__(self, kind: Event, actor, target, value: int, aux: int) -> None:
+        self._queue.append((kind, aux, actor, target, value, time.time()))
+        if len(self._queue) >= self._batch:
+            self._wake.set()
+
+    def _row(self, character) -> int:
+        if self._pool is not None:
+            return character.index if isinstance(character, CharacterView) and character.pool is self._pool else NOBODY
+        return self._rows.get(character, NOBODY)
+
+    def flush(self) -> int:
+        """Write out everything queued so far, returns how many events were written."""
+        with self._flushing:
+            count = len(self._queue)
+            if not count:
+                return 0
+            popleft = self._queue.popleft
+            row = self._row
+            events = []
+            for _ in range(count):
+                kind, aux, actor, target, value, when = popleft()
+                # aux is a byte on disk, only LEVEL_UP's level count runs past it
+                events.append((kind, min(aux, 255), row(actor), row(target), value, when))
+            self._file.write(np.array(events, RECORD).tobytes())
+            self._file.flush()
+        return count
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        unsubscribe(self)
+        self._closed = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "EventLogWriter":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _check_header(file, path) -> None:
+    magic, version = HEADER.unpack(file.read(HEADER.size))
+    assert magic == MAGIC, f"{path} is not an event log"
+    assert version == VERSION, f"Unsupported event log version {version}"
+
+
+class EventLogReader:
+    """Streams a log back ``chunk`` records at a time, never holding the whole log."""
+
+    def __init__(self, path, chunk: int = 1 << 16) -> None:
+        self._path = path
+        self._chunk = chunk
+
+    def chunks(self):
+        with open(self._path, "rb") as file:
+            _check_header(file, self._path)
+            while True:
+                records = np.fromfile(file, RECORD, self._chunk)
+                if not len(records):
+                    return
+                yield records
+
+    def __iter__(self):
+        for records in self.chunks():
+            yield from records.tolist()
+
+
+def replay(path, characters, chunk: int = 1 << 16) -> int:
+    """Re-run a log against fresh ``characters``, indexed by the rows the log was written with.
+
+    Only causes are replayed (attacks, exp, stat, status and level writes);
+    damage, deaths and effect ticks follow from them. ``LEVEL_UP`` carries the
+    level reached, so setting it again after the exp that caused it changes
+    nothing, while a direct ``level`` write is reproduced. Detach any writer
+    first or the replay is logged again. Events caused by characters outside
+    the roster are skipped, as are attacks on them. Returns the number of
+    events applied.
+    """
+    applied = 0
+    for kind, aux, actor, target, value, _ in EventLogReader(path, chunk):
+        if actor == NOBODY:
+            continue
+        if kind == Event.ATTACK:
+            if target == NOBODY:
+                continue
+            characters[actor].attack(characters[target])
+        elif kind == Event.STAT:
+            characters[actor].set_stat(Stat(aux), value)
+        elif kind == Event.STATUS:
+            characters[actor].status = STATUSES[aux]
+        elif kind == Event.EXP:
+            characters[actor].exp = value
+        elif kind == Event.GAIN_EXP:
+            characters[actor].gain_exp(value)
+        elif kind == Event.LEVEL_UP:
+            characters[actor].level = value
+        else:
+            continue
+        applied += 1
+    return applied
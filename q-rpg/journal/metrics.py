@@ -0,0 +1,127 @@
+"""Counters and latency histograms collected from game events.
+
+Collection rides on the event listeners, so a disabled ``Metrics`` is not
+subscribed and costs the hot paths nothing beyond their ``if listeners:`` check.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+
+from overseer import Event, subscribe, unsubscribe, listeners
+from status import default_runner, live_schedulers
+
+# Upper bounds in seconds for tick latency buckets, 1µs to ~10s
+LATENCY_BUCKETS = tuple(round(1e-6 * 2.5 ** power, 9) for power in range(18))
+
+COUNTERS = {
+    Event.ATTACK: "attacks_total",
+    Event.DEATH: "deaths_total",
+    Event.EFFECT_TICK: "effect_ticks_total",
+}
+
+HELP = {
+    "attacks_total": "Attacks resolved.",
+    "damage_total": "Health removed by attacks.",
+    "deaths_total": "Characters killed.",
+    "level_ups_total": "Levels gained.",
+    "effect_ticks_total": "Status effect, buff and debuff ticks applied.",
+    "active_effects": "Effects currently scheduled or running as tasks.",
+    "effect_threads": "Live scheduler threads.",
+    "effect_tasks": "Live asyncio effect tasks.",
+    "tick_latency_seconds": "Time for the scheduler to run one batch of due ticks.",
+}
+
+
+class Metrics:
+    def __init__(self, prefix: str = "qrpg") -> None:
+        self._prefix = prefix
+        # Events arrive from the scheduler thread as well as the game's
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        return self in listeners
+
+    def enable(self) -> None:
+        subscribe(self)
+
+    def disable(self) -> None:
+        unsubscribe(self)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = dict.fromkeys((*COUNTERS.values(), "damage_total", "level_ups_total"), 0)
+            self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+            self._latency_sum = 0.0
+
+    def __call__(self, kind: Event, actor, target, value: int, aux: int) -> None:
+        name = COUNTERS.get(kind)
+        if name is not None:
+            with self._lock:
+                self._counters[name] += 1
+        elif kind == Event.DAMAGE:
+            with self._lock:
+                self._counters["damage_total"] += value
+        elif kind == Event.LEVEL_UP:
+            with self._lock:
+                self._counters["level_ups_total"] += aux
+        elif kind == Event.TICK:
+            self.observe_tick(value / 1e9)
+
+    def observe_tick(self, seconds: float) -> None:
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            self._buckets[bucket] += 1
+            self._latency_sum += seconds
+
+    def gauges(self) -> dict[str, int]:
+        """Summed over every live scheduler, Sessions' included, so reading them never swaps the default one."""
+        schedulers, runner = live_schedulers(), default_runner()
+        return {
+            "active_effects": sum(scheduler.active for scheduler in schedulers) + runner.active,
+            "effect_threads": sum(scheduler.running for scheduler in schedulers),
+            "effect_tasks": runner.active,
+        }
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters, counts, latency_sum = dict(self._counters), list(self._buckets), self._latency_sum
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*LATENCY_BUCKETS, float("inf")), counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            **counters,
+            **self.gauges(),
+            "tick_latency_seconds": {"buckets": buckets, "sum": latency_sum, "count": cumulative},
+        }
+
+    def exposition(self) -> str:
+        """Render a snapshot in the Prometheus text exposition format."""
+        lines = []
+        for name, value in self.snapshot().items():
+            metric = f"{self._prefix}_{name}"
+            lines.append(f"# HELP {metric} {HELP[name]}")
+            if isinstance(value, dict):
+                lines.append(f"# TYPE {metric} histogram")
+                for bound, count in value["buckets"].items():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{metric}_bucket{{le="{le}"}} {count}')
+                lines.append(f"{metric}_sum {value['sum']}")
+                lines.append(f"{metric}_count {value['count']}")
+            else:
+                lines.append(f"# TYPE {metric} {'counter' if name.endswith('_total') else 'gauge'}")
+                lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path) -> None:
+        """Atomically replace ``path`` with the current exposition, for a scraper to pick up."""
+        partial = f"{path}.tmp"
+        with open(partial, "w") as file:
+            file.write(self.exposition())
+        os.replace(partial, path)
+
+
+metrics = Metrics()
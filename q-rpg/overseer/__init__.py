@@ -1,6 +1,44 @@
 """Author: Burhan Qaddoumi - github.com/Burhan-Q"""
 
-from checks import total_check, balance_check
-from level import exp_to_level_up
+from checks import (
+    SHEET_STATS,
+    total_check,
+    balance_check,
+    total_check_batch,
+    balance_check_batch,
+    invalid_sheets,
+    checked_sheets,
+)
+from sheets import SheetIndex, sheet_index
+from events import Event, Listener, listeners, subscribe, unsubscribe, emit
+from stats import Stat, MAX_OFFSET, resolve_stat
+from locks import lock_for
+from heap import IndexedHeap
+from level import exp_to_level_up, exp_between_levels, levels_gained, levels_gained_batch
 
-__all__ = "total_check", "balance_check", "exp_to_level_up"
+__all__ = (
+    "Event",
+    "Listener",
+    "listeners",
+    "subscribe",
+    "unsubscribe",
+    "emit",
+    "Stat",
+    "MAX_OFFSET",
+    "resolve_stat",
+    "SHEET_STATS",
+    "total_check",
+    "balance_check",
+    "total_check_batch",
+    "balance_check_batch",
+    "invalid_sheets",
+    "checked_sheets",
+    "SheetIndex",
+    "sheet_index",
+    "lock_for",
+    "IndexedHeap",
+    "exp_to_level_up",
+    "exp_between_levels",
+    "levels_gained",
+    "levels_gained_batch",
+)
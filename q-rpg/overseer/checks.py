@@ -1,9 +1,40 @@
 """Checks for characters or actions."""
 
+import numpy as np
+
+# Column order of character sheets handed to the batch checks
+SHEET_STATS = ("health", "defense", "strength", "agility", "intelligence")
+
+
 def total_check(properties:dict[str, int]) -> bool:
     return sum(properties.values()) == 200
 
 
 def balance_check(properties:dict[str, int]) -> bool:
     return all([0 <= val <= 100 for val in properties.values()])
-  
+
+
+def total_check_batch(sheets) -> np.ndarray:
+    return np.asarray(sheets).sum(axis=1) == 200
+
+
+def balance_check_batch(sheets) -> np.ndarray:
+    sheets = np.asarray(sheets)
+    return ((sheets >= 0) & (sheets <= 100)).all(axis=1)
+
+
+def invalid_sheets(sheets) -> np.ndarray:
+    """Row indices of an (n, 5) sheet array failing ``total_check`` or ``balance_check``."""
+    sheets = np.asarray(sheets).reshape(-1, len(SHEET_STATS))
+    return np.flatnonzero(~(total_check_batch(sheets) & balance_check_batch(sheets)))
+
+
+def checked_sheets(names: list[str], job_classes: list[str] | str, sheets) -> tuple[np.ndarray, list[str]]:
+    """Validate sheets for a bulk spawn, returns them as an (n, 5) array with one job class per row."""
+    sheets = np.asarray(sheets).reshape(-1, len(SHEET_STATS))
+    invalid = invalid_sheets(sheets)
+    assert not len(invalid), f"Invalid character sheets at rows {invalid.tolist()}"
+    assert len(names) == len(sheets), "Need one name per sheet"
+    if isinstance(job_classes, str):
+        job_classes = [job_classes] * len(sheets)
+    return sheets, job_classes
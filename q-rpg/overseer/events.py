@@ -0,0 +1,67 @@
+"""Game events and the listeners observing them.
+
+Hot paths guard every emit with ``if listeners:``, so with nobody listening
+an event costs a single truthiness check.
+"""
+
+from enum import IntEnum
+
+
+class Event(IntEnum):
+    ATTACK = 0       # actor attacked target, value is the attacker's strength
+    DAMAGE = 1       # actor lost value health defending
+    DEATH = 2        # actor died
+    EXP = 3          # actor's exp was set to value
+    GAIN_EXP = 4     # actor was awarded value exp
+    LEVEL_UP = 5     # actor gained aux levels, reaching level value
+    STAT = 6         # actor's stat aux was set to value
+    STATUS = 7       # actor's status became code aux
+    EFFECT_TICK = 8  # an effect on actor ticked stat aux, value is its remaining duration
+    TICK = 9         # scheduler actor ran aux effect ticks in value nanoseconds
+
+
+# Callables taking (kind, actor, target, value, aux). Mutated in place, never rebound
+listeners: list = []
+
+
+def subscribe(listener) -> None:
+    if listener not in listeners:
+        listeners.append(listener)
+
+
+def unsubscribe(listener) -> None:
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+def emit(kind: Event, actor, target=None, value: int = 0, aux: int = 0) -> None:
+    for listener in listeners:
+        listener(kind, actor, target, value, aux)
+
+
+class Listener:
+    """Base for objects fed by events while subscribed, implementing ``__call__``.
+
+    Nothing is heard until ``watch``. ``listeners`` holds a strong reference
+    until ``close``, so prefer a ``with`` block to bound the subscription.
+    """
+
+    def watch(self) -> "Listener":
+        subscribe(self)
+        return self
+
+    def close(self) -> None:
+        unsubscribe(self)
+
+    @property
+    def watching(self) -> bool:
+        return self in listeners
+
+    def __enter__(self) -> "Listener":
+        return self.watch()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __call__(self, kind: Event, actor, target, value: int, aux: int) -> None:
+        raise NotImplementedError
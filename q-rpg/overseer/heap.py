@@ -0,0 +1,116 @@
+"""Binary heap addressable by item."""
+
+from heapq import heappop, heappush
+
+
+class IndexedHeap:
+    """Min-heap of hashable items whose keys can change or be removed in O(log n).
+
+    ``_positions`` tracks where each item sits in the parallel ``_keys`` and
+    ``_items`` lists so it can be sifted from there, unlike ``heapq``.
+    """
+
+    __slots__ = ("_keys", "_items", "_positions")
+
+    def __init__(self) -> None:
+        self._keys = []
+        self._items = []
+        self._positions = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item) -> bool:
+        return item in self._positions
+
+    def __iter__(self):
+        # Heap order, not sorted
+        return iter(list(self._items))
+
+    def key(self, item):
+        return self._keys[self._positions[item]]
+
+    def push(self, item, key) -> None:
+        """Insert ``item``, or move it to ``key`` if already present."""
+        if item in self._positions:
+            self.update(item, key)
+            return
+        self._keys.append(key)
+        self._items.append(item)
+        self._positions[item] = len(self._items) - 1
+        self._up(len(self._items) - 1)
+
+    def update(self, item, key) -> None:
+        index = self._positions[item]
+        previous = self._keys[index]
+        self._keys[index] = key
+        if key < previous:
+            self._up(index)
+        else:
+            self._down(index)
+
+    def remove(self, item) -> bool:
+        index = self._positions.pop(item, None)
+        if index is None:
+            return False
+        key, last = self._keys.pop(), self._items.pop()
+        if index < len(self._items):
+            # Fill the hole with the last leaf, which may belong above or below it
+            self._keys[index], self._items[index] = key, last
+            self._positions[last] = index
+            self._up(index)
+            self._down(self._positions[last])
+        return True
+
+    def peek(self):
+        return self._items[0] if self._items else None
+
+    def pop(self):
+        item = self.peek()
+        if item is not None:
+            self.remove(item)
+        return item
+
+    def smallest(self, count: int) -> list:
+        """The ``count`` lowest keyed items in order, without disturbing the heap. O(count log count)."""
+        order, frontier = [], [(self._keys[0], 0)] if self._items else []
+        while frontier and len(order) < count:
+            # (key, heap index) pairs are unique by index, so items are never compared
+            _, index = heappop(frontier)
+            order.append(self._items[index])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self._items):
+                    heappush(frontier, (self._keys[child], child))
+        return order
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._items.clear()
+        self._positions.clear()
+
+    def _move(self, index: int, key, item) -> None:
+        self._keys[index] = key
+        self._items[index] = item
+        self._positions[item] = index
+
+    def _up(self, index: int) -> None:
+        key, item = self._keys[index], self._items[index]
+        while index:
+            parent = (index - 1) >> 1
+            if not key < self._keys[parent]:
+                break
+            self._move(index, self._keys[parent], self._items[parent])
+            index = parent
+        self._move(index, key, item)
+
+    def _down(self, index: int) -> None:
+        key, item = self._keys[index], self._items[index]
+        size = len(self._items)
+        while (child := 2 * index + 1) < size:
+            if child + 1 < size and self._keys[child + 1] < self._keys[child]:
+                child += 1
+            if not self._keys[child] < key:
+                break
+            self._move(index, self._keys[child], self._items[child])
+            index = child
+        self._move(index, key, item)
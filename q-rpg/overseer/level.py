@@ -1,4 +1,42 @@
 """Manage experience and levels."""
 
+import numpy as np
+
+
 def exp_to_level_up(level: int) -> int:
     return (level * 10) ** 2
+
+
+def _square_sum(n):
+    # 1² + 2² + ... + n², so exp needed from level 1 to level n + 1 is 100 times this
+    return n * (n + 1) * (2 * n + 1) // 6
+
+
+def exp_between_levels(start: int, end: int) -> int:
+    return 100 * (_square_sum(end - 1) - _square_sum(start - 1))
+
+
+def levels_gained(level: int, exp: int) -> tuple[int, int]:
+    """Levels crossed holding ``exp`` at ``level``, and the exp left over afterwards."""
+    budget = exp // 100 + _square_sum(level - 1)
+    top = max(level - 1, round((3 * budget) ** (1 / 3)))
+    while _square_sum(top) > budget:
+        top -= 1
+    while _square_sum(top + 1) <= budget:
+        top += 1
+    gained = top - (level - 1)
+    return gained, exp - exp_between_levels(level, level + gained)
+
+
+def levels_gained_batch(levels, exp) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ``levels_gained`` over arrays of levels and exp."""
+    levels = np.asarray(levels, dtype=np.int64)
+    exp = np.asarray(exp, dtype=np.int64)
+    base = _square_sum(levels - 1)
+    budget = exp // 100 + base
+    top = np.maximum(levels - 1, np.floor(np.cbrt(3.0 * budget)).astype(np.int64))
+    while (over := _square_sum(top) > budget).any():
+        top[over] -= 1
+    while (under := _square_sum(top + 1) <= budget).any():
+        top[under] += 1
+    return top - (levels - 1), exp - 100 * (_square_sum(top) - base)
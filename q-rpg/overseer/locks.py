@@ -0,0 +1,15 @@
+"""Striped locks guarding per-character state."""
+
+import threading
+
+SHARDS = 64
+
+_locks = tuple(threading.Lock() for _ in range(SHARDS))
+
+
+def lock_for(owner) -> threading.Lock:
+    """Lock shared by every object hashing to the same shard as ``owner``.
+
+    Hold it only around a single owner's read-modify-write, never while taking another.
+    """
+    return _locks[hash(owner) % SHARDS]
@@ -0,0 +1,145 @@
+"""Index of every character sheet passing ``total_check`` and ``balance_check``."""
+
+from numbers import Integral
+
+import numpy as np
+
+from checks import SHEET_STATS
+
+TOTAL = 200
+LOW, HIGH = 0, 100
+# Sheets unranked at a time when iterating an index
+CHUNK = 65536
+
+
+class SheetIndex:
+    """Valid sheets in lexicographic order, ranked and unranked without being stored.
+
+    ``_counts[k][t]`` is how many ways the stats from ``k`` onward can sum to
+    ``t`` within their bounds, held as a prefix sum over ``t`` so the sheets
+    sharing any leading stats are counted by one subtraction. Narrowing the
+    bounds with ``where`` gives another index over just those sheets.
+    """
+
+    __slots__ = ("_low", "_high", "_counts", "_size")
+
+    def __init__(self, low=None, high=None):
+        self._low = np.array(low if low is not None else [LOW] * len(SHEET_STATS), dtype=np.int64)
+        self._high = np.array(high if high is not None else [HIGH] * len(SHEET_STATS), dtype=np.int64)
+        assert len(self._low) == len(self._high) == len(SHEET_STATS), f"Bounds need one entry per stat in {SHEET_STATS}"
+
+        ways = np.zeros(TOTAL + 1, dtype=np.int64)
+        ways[0] = 1
+        counts = [None] * (len(SHEET_STATS) + 1)
+        counts[-1] = np.concatenate(([0], np.cumsum(ways)))
+        for stat in reversed(range(len(SHEET_STATS))):
+            # Ways for this stat onward, summing the next stat's ways over this stat's range
+            prefix = counts[stat + 1]
+            totals = np.arange(TOTAL + 1)
+            upper = np.clip(totals - self._low[stat] + 1, 0, TOTAL + 1)
+            lower = np.clip(totals - self._high[stat], 0, TOTAL + 1)
+            ways = np.where(upper > lower, prefix[upper] - prefix[lower], 0)
+            counts[stat] = np.concatenate(([0], np.cumsum(ways)))
+        self._counts = counts
+        self._size = int(counts[0][TOTAL + 1] - counts[0][TOTAL])
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        bounds = ", ".join(
+            f"{name}={low}..{high}" for name, low, high in zip(SHEET_STATS, self._low.tolist(), self._high.tolist())
+        )
+        return f"SheetIndex({bounds}, size={self._size})"
+
+    @property
+    def bounds(self) -> dict[str, tuple[int, int]]:
+        return {name: (int(low), int(high)) for name, low, high in zip(SHEET_STATS, self._low, self._high)}
+
+    def where(self, **bounds) -> "SheetIndex":
+        """Sheets also within ``bounds``, an integer minimum or a ``(low, high)`` pair per stat.
+
+        ``index.where(agility=60, defense=30)`` holds every build with agility
+        at least 60 and defense at least 30.
+        """
+        low, high = self._low.copy(), self._high.copy()
+        for name, bound in bounds.items():
+            assert name in SHEET_STATS, f"Unknown stat {name!r}, expected one of {SHEET_STATS}"
+            stat = SHEET_STATS.index(name)
+            floor, ceiling = (bound, None) if isinstance(bound, Integral) else bound
+            if floor is not None:
+                low[stat] = max(low[stat], floor)
+            if ceiling is not None:
+                high[stat] = min(high[stat], ceiling)
+        return SheetIndex(low, high)
+
+    def unrank(self, ranks) -> np.ndarray:
+        """Sheets at ``ranks``, an (n, 5) array in ``SHEET_STATS`` order."""
+        ranks = np.array(ranks, dtype=np.int64, ndmin=1)
+        assert ((ranks >= 0) & (ranks < self._size)).all(), f"Ranks must be within 0..{self._size - 1}"
+        sheets = np.empty((len(ranks), len(SHEET_STATS)), dtype=np.int64)
+        remaining = np.full(len(ranks), TOTAL)
+        for stat, low in enumerate(self._low):
+            prefix = self._counts[stat + 1]
+            # Sheets with value v here number prefix[t - v + 1] - prefix[t - v], so those before x
+            # come to prefix[t - low + 1] - prefix[t - x + 1]; pick the smallest x covering the rank
+            start = prefix[remaining - low + 1]
+            boundary = np.searchsorted(prefix, start - ranks, side="left") - 1
+            value = remaining - boundary
+            ranks = ranks - (start - prefix[boundary + 1])
+            sheets[:, stat] = value
+            remaining = remaining - value
+        return sheets
+
+    def rank(self, sheets) -> np.ndarray:
+        """Ranks of valid ``sheets`` within this index, the inverse of ``unrank``."""
+        sheets = np.asarray(sheets, dtype=np.int64).reshape(-1, len(SHEET_STATS))
+        assert self.contains(sheets).all(), "Sheets must be valid and within this index's bounds"
+        ranks = np.zeros(len(sheets), dtype=np.int64)
+        remaining = np.full(len(sheets), TOTAL)
+        for stat, low in enumerate(self._low):
+            prefix = self._counts[stat + 1]
+            value = sheets[:, stat]
+            ranks += prefix[remaining - low + 1] - prefix[remaining - value + 1]
+            remaining = remaining - value
+        return ranks
+
+    def __getitem__(self, rank: int) -> dict[str, int]:
+        if rank < 0:
+            rank += self._size
+        return dict(zip(SHEET_STATS, self.unrank(rank)[0].tolist()))
+
+    def contains(self, sheets) -> np.ndarray:
+        sheets = np.asarray(sheets).reshape(-1, len(SHEET_STATS))
+        return (sheets.sum(axis=1) == TOTAL) & ((sheets >= self._low) & (sheets <= self._high)).all(axis=1)
+
+    def __contains__(self, sheet) -> bool:
+        if isinstance(sheet, dict):
+            sheet = [sheet[name] for name in SHEET_STATS]
+        return bool(self.contains(sheet)[0])
+
+    def sample(self, count: int, rng: np.random.Generator = None) -> np.ndarray:
+        """``count`` sheets drawn uniformly, each a constant number of lookups."""
+        assert self._size, "No sheets satisfy these bounds"
+        rng = rng or np.random.default_rng()
+        return self.unrank(rng.integers(0, self._size, count))
+
+    def sheets(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """Sheets ranked ``start`` up to ``stop``, materializing only that slice."""
+        stop = self._size if stop is None else min(stop, self._size)
+        return self.unrank(np.arange(start, max(start, stop)))
+
+    def __iter__(self):
+        for start in range(0, self._size, CHUNK):
+            yield from self.sheets(start, start + CHUNK)
+
+
+_default = None
+
+
+def sheet_index() -> SheetIndex:
+    """Shared index over all valid sheets."""
+    global _default
+    if _default is None:
+        _default = SheetIndex()
+    return _default
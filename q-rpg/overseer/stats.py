@@ -0,0 +1,38 @@
+"""Character stats and their order in stat columns and arrays."""
+
+from enum import IntEnum
+
+
+class Stat(IntEnum):
+    HEALTH = 0
+    DEFENSE = 1
+    STRENGTH = 2
+    AGILITY = 3
+    INTELLIGENCE = 4
+    MAX_HEALTH = 5
+    MAX_DEFENSE = 6
+    MAX_STRENGTH = 7
+    MAX_AGILITY = 8
+    MAX_INTELLIGENCE = 9
+
+
+# Offset from a stat to its max_ counterpart
+MAX_OFFSET = Stat.MAX_HEALTH - Stat.HEALTH
+
+# Every spelling resolved without lowering first, no others are added at runtime
+_names = {}
+for _stat in Stat:
+    for _spelling in (_stat.name.lower(), _stat.name, _stat.name.capitalize(), _stat.name.title()):
+        _names[_spelling] = _stat
+
+
+def resolve_stat(name: str | Stat) -> Stat:
+    """Resolve a stat from names such as ``"health"`` or ``"Max_Agility"``, in any case."""
+    if isinstance(name, Stat):
+        return name
+    stat = _names.get(name)
+    if stat is None:
+        stat = _names.get(name.lower())
+        if stat is None:
+            raise ValueError(f"{name!r} is not a stat")
+    return stat
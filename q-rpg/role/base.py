@@ -1,43 +1,47 @@
 """Core components for characters."""
 
-import threading
+import asyncio
+from operator import attrgetter
 
-from overseer import total_check, balance_check, exp_to_level_up
-from status import Status, StatusEffect, Buff, Debuff
+import numpy as np
 
+from items import BaseItem
+from overseer import (
+    Event,
+    Stat,
+    emit,
+    listeners,
+    resolve_stat,
+    total_check,
+    balance_check,
+    checked_sheets,
+    exp_to_level_up,
+    levels_gained,
+    lock_for,
+)
+from status import STATUS_CODES, Status, StatusEffect, Buff, Debuff, ModifierStack, default_runner, default_scheduler
+
+
+# Slot holding each stat, indexed by Stat
+STAT_SLOTS = tuple(f"_{stat.name.lower()}" for stat in Stat)
+
+# Reader of each stat, indexed by Stat. Writers depend on the class, see ``_stat_writers``
+STAT_READERS = tuple(attrgetter(slot) for slot in STAT_SLOTS)
+
+
+def _stat_writers(cls: type) -> tuple:
+    """Setter of each stat slot on ``cls``, indexed by Stat."""
+    return tuple(getattr(cls, slot).__set__ for slot in STAT_SLOTS)
+
+
+# Readers for what ``attribute_check`` is usually given, other spellings go through resolve_stat
+_checked = {**dict(zip(Stat, STAT_READERS)), **{stat.name.lower(): read for stat, read in zip(Stat, STAT_READERS)}}
 
-class CharacterAttributes:
-    def __init__(
-            self,
-            name: str,
-            job_class: str,
-            health: int = 100,
-            defense: int = 25,
-            strength: int = 25,
-            agility: int = 25,
-            intelligence: int = 25,
-    ) -> None:
-        character_sheet = dict(
-            health=health,
-            defense=defense,
-            strength=strength,
-            agility=agility,
-            intelligence=intelligence
-        )
-        assert total_check(character_sheet), "Total must equal 200"
-        assert balance_check(character_sheet), "Values must be between 0 and 100"
-        self._name = name
-        self._job_class = job_class
-        self._health = health
-        self._defense = defense
-        self._strength = strength
-        self._agility = agility
-        self._intelligence = intelligence
-        self.__max_health = health
-        self.__max_defense = defense
-        self.__max_strength = strength
-        self.__max_agility = agility
-        self.__max_intelligence = intelligence
+
+class BaseAttributes:
+    """Stat properties and their event hooks, over ``STAT_SLOTS`` a subclass provides."""
+
+    __slots__ = ()
 
     @property
     def name(self) -> str:
@@ -53,16 +57,19 @@ class CharacterAttributes:
         
     @health.setter
     def health(self, value: int) -> None:
-        self._health = value
-        self._health = max(0, self._health)
-    
+        self._health = max(0, value)
+        if listeners:
+            emit(Event.STAT, self, value=self._health, aux=Stat.HEALTH)
+
     @property
     def max_health(self) -> int:
-        return self.__max_health
-    
+        return self._max_health
+
     @max_health.setter
     def max_health(self, value: int) -> None:
-        self.__max_health = value
+        self._max_health = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.MAX_HEALTH)
 
     @property
     def defense(self) -> int:
@@ -71,15 +78,19 @@ class CharacterAttributes:
     @defense.setter
     def defense(self, value: int) -> None:
         self._defense = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.DEFENSE)
 
     @property
     def max_defense(self) -> int:
-        return self.__max_defense
+        return self._max_defense
 
     @max_defense.setter
     def max_defense(self, value: int) -> None:
-        self.__max_defense = value        
-    
+        self._max_defense = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.MAX_DEFENSE)
+
     @property
     def strength(self) -> int:
         return self._strength
@@ -87,15 +98,19 @@ class CharacterAttributes:
     @strength.setter
     def strength(self, value: int) -> None:
         self._strength = value
-    
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.STRENGTH)
+
     @property
     def max_strength(self) -> int:
-        return self.__max_strength
-    
+        return self._max_strength
+
     @max_strength.setter
     def max_strength(self, value: int) -> None:
-        self.__max_strength = value
-    
+        self._max_strength = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.MAX_STRENGTH)
+
     @property
     def agility(self) -> int:
         return self._agility
@@ -103,30 +118,70 @@ class CharacterAttributes:
     @agility.setter
     def agility(self, value: int) -> None:
         self._agility = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.AGILITY)
 
     @property
     def max_agility(self) -> int:
-        return self.__max_agility
-    
+        return self._max_agility
+
     @max_agility.setter
     def max_agility(self, value: int) -> None:
-        self.__max_agility = value
+        self._max_agility = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.MAX_AGILITY)
 
     @property
     def intelligence(self) -> int:
         return self._intelligence
-    
+
     @intelligence.setter
     def intelligence(self, value: int) -> None:
         self._intelligence = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.INTELLIGENCE)
 
     @property
     def max_intelligence(self) -> int:
-        return self.__max_intelligence
-    
+        return self._max_intelligence
+
     @max_intelligence.setter
     def max_intelligence(self, value: int) -> None:
-        self.__max_intelligence = value
+        self._max_intelligence = value
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=Stat.MAX_INTELLIGENCE)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Built once a class has the stat slots, which pool views back with columns instead
+        if all(hasattr(cls, slot) for slot in STAT_SLOTS):
+            cls._stat_writers = _stat_writers(cls)
+
+    def stat(self, stat: Stat | str) -> int:
+        return STAT_READERS[resolve_stat(stat)](self)
+
+    def set_stat(self, stat: Stat | str, value: int) -> None:
+        stat = resolve_stat(stat)
+        value = self._store(stat, value)
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=stat)
+
+    def adjust_stat(self, stat: Stat | str, delta: int) -> int:
+        """Atomically add ``delta`` to a stat, safe against concurrent effects. Returns the new value."""
+        stat = resolve_stat(stat)
+        with lock_for(self):
+            value = self._store(stat, STAT_READERS[stat](self) + delta)
+        # Listeners run outside the lock, they may well touch this character again
+        if listeners:
+            emit(Event.STAT, self, value=value, aux=stat)
+        return value
+
+    def _store(self, stat: Stat, value: int) -> int:
+        """Write a stat without emitting, returns the value stored."""
+        if stat == Stat.HEALTH:
+            value = max(0, value)
+        self._stat_writers[stat](self, value)
+        return value
 
     def asdict(self) -> dict:
         return {
@@ -151,17 +206,72 @@ class CharacterAttributes:
         """
 
 
-class Character(CharacterAttributes):
+class CharacterAttributes(BaseAttributes):
+    __slots__ = (
+        "_name",
+        "_job_class",
+        "_health",
+        "_defense",
+        "_strength",
+        "_agility",
+        "_intelligence",
+        "_max_health",
+        "_max_defense",
+        "_max_strength",
+        "_max_agility",
+        "_max_intelligence",
+    )
+
     def __init__(
             self,
-            attributes: CharacterAttributes
-        ) -> None:
-        super().__init__(**attributes.asdict())
-        self._exp = 0
-        self._level = 1
-        self._exp_to_next_level = exp_to_level_up(self._level)
-        self.status = Status.HEALTHY
-    
+            name: str,
+            job_class: str,
+            health: int = 100,
+            defense: int = 25,
+            strength: int = 25,
+            agility: int = 25,
+            intelligence: int = 25,
+    ) -> None:
+        character_sheet = dict(
+            health=health,
+            defense=defense,
+            strength=strength,
+            agility=agility,
+            intelligence=intelligence
+        )
+        assert total_check(character_sheet), "Total must equal 200"
+        assert balance_check(character_sheet), "Values must be between 0 and 100"
+        self._assign(name, job_class, health, defense, strength, agility, intelligence)
+
+    def _assign(
+            self,
+            name: str,
+            job_class: str,
+            health: int,
+            defense: int,
+            strength: int,
+            agility: int,
+            intelligence: int,
+    ) -> None:
+        self._name = name
+        self._job_class = job_class
+        self._health = health
+        self._defense = defense
+        self._strength = strength
+        self._agility = agility
+        self._intelligence = intelligence
+        self._max_health = health
+        self._max_defense = defense
+        self._max_strength = strength
+        self._max_agility = agility
+        self._max_intelligence = intelligence
+
+
+class BaseCharacter(BaseAttributes):
+    """Everything a character does, leaving where its state lives to subclasses."""
+
+    __slots__ = ()
+
     @property
     def exp(self) -> int:
         return self._exp
@@ -169,45 +279,149 @@ class Character(CharacterAttributes):
     @exp.setter
     def exp(self, value: int) -> None:
         self._exp = value
+        if listeners:
+            emit(Event.EXP, self, value=value)
         if self._exp >= self._exp_to_next_level:
             self.level_up()
 
+    @property
+    def status(self) -> Status:
+        return self._status
+
+    @status.setter
+    def status(self, value: Status) -> None:
+        died = value == Status.DEAD and self._status != Status.DEAD
+        self._status = value
+        if listeners:
+            self._status_changed(value, died)
+
+    def set_status(self, status: Status) -> bool:
+        """Atomically set status, returns False rather than overwrite ``Status.DEAD``."""
+        with lock_for(self):
+            if self._status == Status.DEAD and status != Status.DEAD:
+                return False
+            died = status == Status.DEAD and self._status != Status.DEAD
+            self._status = status
+        if listeners:
+            self._status_changed(status, died)
+        return True
+
+    def _status_changed(self, status: Status, died: bool) -> None:
+        emit(Event.STATUS, self, aux=STATUS_CODES[status])
+        if died:
+            emit(Event.DEATH, self)
+
+    @property
+    def modifiers(self) -> ModifierStack:
+        if self._modifiers is None:
+            self._modifiers = ModifierStack(self)
+        return self._modifiers
+
     @property
     def level(self) -> int:
         return self._level
     
     @level.setter
     def level(self, value: int) -> None:
+        gained = value - self._level
         self._level = value
+        if listeners:
+            emit(Event.LEVEL_UP, self, value=value, aux=max(gained, 0))
     
-    def attribute_check(self, attribute: str, value: int) -> bool:
-        return getattr(self, attribute) >= value
+    def attribute_check(self, attribute: Stat | str, value: int) -> bool:
+        read = _checked.get(attribute)
+        if read is None:
+            try:
+                read = STAT_READERS[resolve_stat(attribute)]
+            except ValueError:
+                # Not a stat, e.g. "level"
+                return getattr(self, attribute) >= value
+        return read(self) >= value
+
+    def _swing(self, target: "Character") -> int | None:
+        """The damage an attack on ``target`` deals, None from the dead."""
+        if self.status == Status.DEAD:
+            return None
+        strength = self.strength
+        if listeners:
+            emit(Event.ATTACK, self, target, strength)
+        return strength
 
     def attack(self, target: "Character") -> None:
-        if self.status != Status.DEAD:
-            target.defend(self.strength)
+        damage = self._swing(target)
+        if damage is not None:
+            target.defend(damage)
 
     def defend(self, damage: int) -> None:
         damage -= self.defense
-        if damage > 0:
-            self.health -= damage
-        if self.health <= 0:
-            self.status = Status.DEAD
-
-    # def use_item(self, item: Item) -> None:
-    #     setattr(
-    #         self,
-    #         item.effect.lower(),
-    #         getattr(self, item.effect.lower()) + item.value
-    #     )
+        with lock_for(self):
+            lost = 0
+            if damage > 0:
+                lost = min(damage, self._health)
+                self._health -= lost
+            health = self._health
+            died = health <= 0 and self._status != Status.DEAD
+            if health <= 0:
+                # DEATH is emitted below, once the lock is released
+                self._status = Status.DEAD
+        if listeners:
+            if damage > 0:
+                emit(Event.STAT, self, value=health, aux=Stat.HEALTH)
+                emit(Event.DAMAGE, self, value=lost)
+            if died:
+                emit(Event.DEATH, self)
+
+    async def attack_async(self, target: "Character") -> None:
+        damage = self._swing(target)
+        if damage is not None:
+            await target.defend_async(damage)
+
+    async def defend_async(self, damage: int) -> None:
+        self.defend(damage)
+        if self.status == Status.DEAD:
+            default_runner().cancel_target(self)
+        # Let effect tasks run between blows
+        await asyncio.sleep(0)
+
+    def use_item(self, item: BaseItem) -> None:
+        self.adjust_stat(item.effect, item.value)
 
     def level_up(self) -> None:
-        for attribute in {"max_strength", "max_agility", "max_intelligence", "max_defense"}:
-            setattr(self, attribute, getattr(self, attribute) + 1)
+        self._max_strength += 1
+        self._max_agility += 1
+        self._max_intelligence += 1
+        self._max_defense += 1
         self.exp = 0
         self._level += 1
         self.max_health += 10
         self._exp_to_next_level = exp_to_level_up(self._level)
+        if listeners:
+            emit(Event.LEVEL_UP, self, value=self._level, aux=1)
+
+    def gain_exp(self, amount: int) -> int:
+        """Award exp, crossing as many levels as it covers and keeping the overflow."""
+        if listeners:
+            emit(Event.GAIN_EXP, self, value=amount)
+        levels, self._exp = levels_gained(self._level, self._exp + amount)
+        if levels:
+            self._max_strength += levels
+            self._max_agility += levels
+            self._max_intelligence += levels
+            self._max_defense += levels
+            self.max_health += 10 * levels
+            self._level += levels
+            self._exp_to_next_level = exp_to_level_up(self._level)
+            if listeners:
+                emit(Event.LEVEL_UP, self, value=self._level, aux=levels)
+        return levels
+
+    @staticmethod
+    def distribute_exp(party: list["Character"], amount) -> list[int]:
+        """Award ``amount`` (one value, or one per member) to every member of a party."""
+        if np.ndim(amount) == 0:
+            amount = [int(amount)] * len(party)
+        assert len(amount) == len(party), f"{len(amount)} awards for a party of {len(party)}"
+        return [member.gain_exp(award) for member, award in zip(party, amount)]
     
     def apply_buff(self, buff:Buff) -> None:
         buff.apply(self)
@@ -217,10 +431,18 @@ class Character(CharacterAttributes):
 
     def effect(self, effect:StatusEffect) -> None:
         self._e = effect  # TODO make this a property
-        threading.Thread(target=effect.apply, kwargs={"target": self}, daemon=True).start()
-        if self._e.expired and self.status != Status.DEAD:
-            self.status = Status.HEALTHY
+        default_scheduler().schedule(effect, self)
+        if self._e.expired:
+            self.set_status(Status.HEALTHY)
     
+    def effect_async(self, effect: StatusEffect) -> asyncio.Task:
+        """Run ``effect`` as a task on the running event loop instead of the scheduler thread."""
+        self._e = effect
+        return default_runner().start(effect, self)
+
+    def cleanse(self, effect: StatusEffect) -> bool:
+        return default_runner().cleanse(effect, self)
+
     def __repr__(self) -> str:
         return f"{self.name} +++ Class:{self.job_class} +++ Level:{self.level} +++ XP:{self.exp} +++ Status:{self.status.value}"
     
@@ -231,4 +453,46 @@ class Character(CharacterAttributes):
         self.exp += val
     
     def __sub__(self, val) -> None:
-        self.health -= val
+        self.adjust_stat(Stat.HEALTH, -val)
+
+
+class Character(BaseCharacter, CharacterAttributes):
+    __slots__ = ("_exp", "_level", "_exp_to_next_level", "_status", "_e", "_modifiers")
+
+    def __init__(
+            self,
+            attributes: CharacterAttributes
+        ) -> None:
+        super().__init__(
+            attributes.name,
+            attributes.job_class,
+            attributes.health,
+            attributes.defense,
+            attributes.strength,
+            attributes.agility,
+            attributes.intelligence,
+        )
+        self._start()
+
+    def _start(self) -> None:
+        self._exp = 0
+        self._level = 1
+        self._exp_to_next_level = exp_to_level_up(self._level)
+        self._status = Status.HEALTHY
+        self._modifiers = None
+
+    @classmethod
+    def spawn(cls, names: list[str], job_classes: list[str] | str, sheets) -> list["Character"]:
+        """Build characters from an (n, 5) array of sheets, validated in one pass.
+
+        Sheet columns follow ``SHEET_STATS``: health, defense, strength, agility, intelligence.
+        """
+        sheets, job_classes = checked_sheets(names, job_classes, sheets)
+        characters = []
+        for name, job_class, sheet in zip(names, job_classes, sheets.tolist()):
+            character = cls.__new__(cls)
+            character._assign(name, job_class, *sheet)
+            character._start()
+            characters.append(character)
+        return characters
+    
@@ -0,0 +1,52 @@
+"""Batched combat resolution over a CharacterPool."""
+
+import numpy as np
+
+from role.dirty import Dirty
+from role.pool import CharacterPool, DEAD
+
+
+def resolve_attacks(pool: CharacterPool, attackers, targets) -> np.ndarray:
+    """Resolve ``attackers[i].attack(targets[i])`` for every pair, in order.
+
+    The outcome matches running the pairs one at a time through ``Character.attack``:
+    attackers that are dead, or die earlier in the same round, skip their attack.
+    Returns the damage each pair dealt.
+    """
+    attackers = np.asarray(attackers, dtype=np.intp)
+    targets = np.asarray(targets, dtype=np.intp)
+    pairs = len(attackers)
+    if pairs == 0:
+        return np.zeros(0, np.int64)
+    health = pool.health.astype(np.int64)
+    alive = pool.alive[attackers]
+    raw = np.maximum(pool.strength[attackers].astype(np.int64) - pool.defense[targets], 0)
+
+    # Group pairs by target, keeping round order within each group
+    order = np.argsort(targets, kind="stable")
+    grouped = targets[order]
+    starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    group = np.cumsum(np.r_[True, grouped[1:] != grouped[:-1]]) - 1
+    position = np.arange(pairs)
+
+    # An attacker's turn only depends on earlier pairs, so each pass fixes at
+    # least the first pair that was wrong in the previous one
+    active = alive
+    while True:
+        damage = np.where(active, raw, 0)
+        dealt = np.cumsum(damage[order])
+        dealt -= (dealt[starts] - damage[order][starts])[group]
+        dies = active[order] & (health[grouped] - dealt <= 0)
+        died_at = np.full(len(pool), pairs, np.intp)
+        np.minimum.at(died_at, grouped[dies], order[dies])
+        settled = alive & (died_at[attackers] >= position)
+        if np.array_equal(settled, active):
+            break
+        active = settled
+
+    total = np.bincount(targets, weights=damage, minlength=len(pool)).astype(np.int64)
+    pool.health[:] = np.maximum(health - total, 0)
+    pool.status[died_at < pairs] = DEAD
+    pool.mark(np.flatnonzero(total), Dirty.HEALTH)
+    pool.mark(died_at < pairs, Dirty.STATUS)
+    return damage
@@ -0,0 +1,118 @@
+"""Change tracking for incremental persistence and sync."""
+
+import threading
+from enum import IntFlag
+
+from overseer import Event, Listener, Stat
+from role.base import Character
+from status import STATUS_CODES
+
+
+class Dirty(IntFlag):
+    HEALTH = 1 << Stat.HEALTH
+    DEFENSE = 1 << Stat.DEFENSE
+    STRENGTH = 1 << Stat.STRENGTH
+    AGILITY = 1 << Stat.AGILITY
+    INTELLIGENCE = 1 << Stat.INTELLIGENCE
+    MAX_HEALTH = 1 << Stat.MAX_HEALTH
+    MAX_DEFENSE = 1 << Stat.MAX_DEFENSE
+    MAX_STRENGTH = 1 << Stat.MAX_STRENGTH
+    MAX_AGILITY = 1 << Stat.MAX_AGILITY
+    MAX_INTELLIGENCE = 1 << Stat.MAX_INTELLIGENCE
+    EXP = 1 << 10
+    LEVEL = 1 << 11
+    STATUS = 1 << 12
+
+
+ALL = Dirty(sum(Dirty))
+
+# Everything a level up can touch, see ``Character.gain_exp``
+LEVELED = (
+    Dirty.EXP | Dirty.LEVEL | Dirty.MAX_HEALTH | Dirty.MAX_DEFENSE
+    | Dirty.MAX_STRENGTH | Dirty.MAX_AGILITY | Dirty.MAX_INTELLIGENCE
+)
+
+EVENT_FIELDS = {
+    Event.EXP: Dirty.EXP,
+    Event.GAIN_EXP: Dirty.EXP,
+    Event.LEVEL_UP: LEVELED,
+    Event.STATUS: Dirty.STATUS,
+    Event.DEATH: Dirty.STATUS,
+}
+
+
+def changed_fields(character: Character, fields: Dirty) -> dict[str, int]:
+    """Current values of ``fields``, keyed by ``Stat`` name in lower case, ``exp``, ``level`` and ``status``.
+
+    Status is given as its code in ``STATUS_CODES``.
+    """
+    delta = {stat.name.lower(): character.stat(stat) for stat in Stat if fields & (1 << stat)}
+    if fields & Dirty.EXP:
+        delta["exp"] = character.exp
+    if fields & Dirty.LEVEL:
+        delta["level"] = character.level
+    if fields & Dirty.STATUS:
+        delta["status"] = STATUS_CODES[character.status]
+    return delta
+
+
+class ChangeTracker(Listener):
+    """Dirty bitmasks for the characters being tracked, fed by game events.
+
+    Characters start clean when tracked. Nothing is added to the setters:
+    while watching, ``STAT``, ``EXP``, ``LEVEL_UP``, ``STATUS`` and ``DEATH``
+    events mark fields as they are emitted, so untracked play only pays the
+    usual ``if listeners:`` check. Both ``character.status`` and
+    ``set_status`` emit, ``CharacterPool`` columns written in bulk do not;
+    pool rows are tracked by the pool itself, see ``CharacterPool.track_changes``.
+    """
+
+    def __init__(self, characters=(), watch: bool = False) -> None:
+        self._tracked = set(characters)
+        # Only characters with changes since the last ``changes``
+        self._masks = {}
+        self._lock = threading.Lock()
+        if watch:
+            self.watch()
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def __contains__(self, character: Character) -> bool:
+        return character in self._tracked
+
+    def track(self, character: Character) -> None:
+        self._tracked.add(character)
+
+    def untrack(self, character: Character) -> None:
+        with self._lock:
+            self._tracked.discard(character)
+            self._masks.pop(character, None)
+
+    def mask(self, character: Character) -> Dirty:
+        return Dirty(self._masks.get(character, 0))
+
+    def mark(self, character: Character, fields: Dirty) -> None:
+        with self._lock:
+            self._masks[character] = self._masks.get(character, 0) | fields
+
+    def changes(self, clear: bool = True) -> dict[Character, Dirty]:
+        """Dirty characters and their fields since the last clear, in O(changed)."""
+        with self._lock:
+            masks = self._masks
+            if clear:
+                self._masks = {}
+            else:
+                masks = dict(masks)
+        return {character: Dirty(fields) for character, fields in masks.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._masks = {}
+
+    def __call__(self, kind: Event, actor, target, value: int, aux: int) -> None:
+        if actor not in self._tracked:
+            return
+        fields = 1 << aux if kind == Event.STAT else EVENT_FIELDS.get(kind)
+        if fields:
+            self.mark(actor, fields)
@@ -0,0 +1,76 @@
+"""Groups of living characters kept current by game events."""
+
+import threading
+
+from overseer import Event, Listener, Stat
+from role.base import Character
+from status import STATUS_CODES, Status
+
+DEAD = STATUS_CODES[Status.DEAD]
+
+
+class LivingGroup(Listener):
+    """Living members in join order, dropped when they die.
+
+    Subclasses store members in ``_join``/``_leave`` and re-key them in
+    ``_restat``, all called holding ``_lock``.
+    """
+
+    # Stats whose STAT events re-key a member
+    _watched_stats: frozenset = frozenset()
+
+    def __init__(self, members=(), watch: bool = False) -> None:
+        # Join order of each member, breaking ties
+        self._joined = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+        for character in members:
+            self.add(character)
+        if watch:
+            self.watch()
+
+    def __len__(self) -> int:
+        return len(self._joined)
+
+    def __contains__(self, character: Character) -> bool:
+        return character in self._joined
+
+    def add(self, character: Character) -> bool:
+        """Join ``character``, returns False for the dead or those already in."""
+        with self._lock:
+            if character in self._joined or character.status == Status.DEAD:
+                return False
+            self._joined[character] = self._sequence
+            self._sequence += 1
+            self._join(character)
+            return True
+
+    def remove(self, character: Character) -> bool:
+        with self._lock:
+            if self._joined.pop(character, None) is None:
+                return False
+            self._leave(character)
+            return True
+
+    def update(self, character: Character, stat: Stat = None) -> None:
+        """Re-key ``character`` on ``stat``, or on everything it is ranked by."""
+        with self._lock:
+            if character in self._joined:
+                self._restat(character, stat)
+
+    def _join(self, character: Character) -> None:
+        raise NotImplementedError
+
+    def _leave(self, character: Character) -> None:
+        raise NotImplementedError
+
+    def _restat(self, character: Character, stat: Stat | None) -> None:
+        raise NotImplementedError
+
+    def __call__(self, kind: Event, actor, target, value: int, aux: int) -> None:
+        if actor not in self._joined:
+            return
+        if kind == Event.STAT and aux in self._watched_stats:
+            self.update(actor, Stat(aux))
+        elif kind == Event.DEATH or (kind == Event.STATUS and aux == DEAD):
+            self.remove(actor)
@@ -0,0 +1,81 @@
+"""Agility-ordered turn taking for large battles."""
+
+from overseer import IndexedHeap, Stat
+from role.base import Character
+from role.group import LivingGroup
+
+
+class InitiativeQueue(LivingGroup):
+    """Hands out turns highest agility first, everyone once per round.
+
+    Combatants wait in one heap until they act and then sit in a second;
+    when the first runs dry the two swap, so each new round starts already
+    ordered instead of re-sorting everyone. Ties go to whoever joined first.
+
+    While watching, agility changes re-prioritize a combatant and deaths
+    remove it, each in O(log n), through the ``STAT``, ``STATUS`` and
+    ``DEATH`` events. Bulk writes to ``CharacterPool`` columns emit nothing,
+    call ``update`` or ``remove`` for those rows.
+    """
+
+    _watched_stats = frozenset((Stat.AGILITY,))
+
+    def __init__(self, combatants=(), watch: bool = False) -> None:
+        self._waiting = IndexedHeap()
+        self._acted = IndexedHeap()
+        self._round = 1
+        super().__init__(combatants, watch)
+
+    @property
+    def round(self) -> int:
+        return self._round
+
+    def _key(self, character: Character) -> tuple[int, int]:
+        return -character.agility, self._joined[character]
+
+    def _join(self, character: Character) -> None:
+        self._waiting.push(character, self._key(character))
+
+    def _leave(self, character: Character) -> None:
+        if not self._waiting.remove(character):
+            self._acted.remove(character)
+
+    def _restat(self, character: Character, stat: Stat | None) -> None:
+        # Re-read agility whether it has acted this round or not
+        heap = self._waiting if character in self._waiting else self._acted
+        heap.update(character, self._key(character))
+
+    def next(self) -> Character | None:
+        """Whoever acts next, starting a new round when everyone has had a turn."""
+        with self._lock:
+            if not self._waiting:
+                if not self._acted:
+                    return None
+                self._waiting, self._acted = self._acted, self._waiting
+                self._round += 1
+            character = self._waiting.peek()
+            self._acted.push(character, self._waiting.key(character))
+            self._waiting.remove(character)
+            return character
+
+    def upcoming(self, count: int = None) -> list[Character]:
+        """Those yet to act this round in turn order, without taking their turns."""
+        with self._lock:
+            return self._waiting.smallest(len(self._waiting) if count is None else count)
+
+    def turns(self):
+        """Yield each turn of the current round, or the next if this one is over."""
+        if not self._waiting:
+            self.next_round()
+        current = self._round
+        while self._waiting and self._round == current:
+            yield self.next()
+
+    def next_round(self) -> None:
+        """Skip whoever has yet to act and start a fresh round."""
+        with self._lock:
+            for character in list(self._waiting):
+                self._acted.push(character, self._waiting.key(character))
+            self._waiting.clear()
+            self._waiting, self._acted = self._acted, self._waiting
+            self._round += 1
@@ -0,0 +1,272 @@
+"""Columnar storage for large character rosters."""
+
+import numpy as np
+
+from overseer import SHEET_STATS, Stat, checked_sheets, exp_to_level_up, levels_gained_batch
+from role.base import BaseCharacter, CharacterAttributes
+from role.dirty import ALL, LEVELED, Dirty
+from status import STATUS_CODES, Status
+
+STATUSES = tuple(Status)
+DEAD = STATUS_CODES[Status.DEAD]
+
+COLUMNS = {
+    "health": np.int32,
+    "max_health": np.int32,
+    "defense": np.int32,
+    "max_defense": np.int32,
+    "strength": np.int32,
+    "max_strength": np.int32,
+    "agility": np.int32,
+    "max_agility": np.int32,
+    "intelligence": np.int32,
+    "max_intelligence": np.int32,
+    "exp": np.int64,
+    "level": np.int32,
+    "status": np.int8,
+}
+
+
+class CharacterPool:
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._names: list[str] = []
+        self._job_classes: list[str] = []
+        # Views are transient, so modifier stacks live with the pool by row
+        self._modifiers: dict[int, "ModifierStack"] = {}
+        self._columns = {name: np.zeros(max(1, capacity), dtype) for name, dtype in COLUMNS.items()}
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Columns are exposed as views trimmed to the live rows, e.g. ``pool.health``
+        columns = self.__dict__.get("_columns")
+        if columns is None or name not in columns:
+            raise AttributeError(name)
+        return columns[name][:self._size]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns["health"])
+
+    @property
+    def names(self) -> list[str]:
+        return self._names
+
+    @property
+    def job_classes(self) -> list[str]:
+        return self._job_classes
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self.status != DEAD
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    @property
+    def tracking(self) -> bool:
+        return "dirty" in self._columns
+
+    def track_changes(self, enabled: bool = True) -> None:
+        """Keep a ``Dirty`` mask per row, marked by row writes and the bulk methods.
+
+        Rows start clean. Writes straight into column arrays are not seen, ``mark`` them.
+        """
+        if enabled and not self.tracking:
+            self._columns["dirty"] = np.zeros(self.capacity, np.uint16)
+        elif not enabled:
+            self._columns.pop("dirty", None)
+
+    def mark(self, rows, fields: Dirty) -> None:
+        dirty = self._columns.get("dirty")
+        if dirty is not None:
+            dirty[:self._size][rows] |= np.uint16(fields)
+
+    def changes(self, clear: bool = True) -> tuple[np.ndarray, np.ndarray]:
+        """Rows changed since the last clear and their ``Dirty`` masks."""
+        dirty = self._columns.get("dirty")
+        if dirty is None:
+            return np.zeros(0, np.intp), np.zeros(0, np.uint16)
+        rows = np.flatnonzero(dirty[:self._size])
+        masks = dirty[rows]
+        if clear:
+            dirty[rows] = 0
+        return rows, masks
+
+    def _reserve(self, size: int) -> None:
+        if size <= self.capacity:
+            return
+        capacity = max(size, self.capacity * 2)
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def add(self, attributes: CharacterAttributes) -> int:
+        index = self._size
+        self._reserve(index + 1)
+        self._size += 1
+        self._names.append(attributes.name)
+        self._job_classes.append(attributes.job_class)
+        row = self[index]
+        for stat, write in zip(Stat, row._stat_writers):
+            write(row, attributes.stat(stat))
+        if isinstance(attributes, BaseCharacter):
+            row._exp = attributes.exp
+            row._level = attributes.level
+            row._status = attributes.status
+        else:
+            row._exp = 0
+            row._level = 1
+            row._status = Status.HEALTHY
+        self.mark(index, ALL)
+        return index
+
+    def extend(self, roster) -> range:
+        start = self._size
+        for attributes in roster:
+            self.add(attributes)
+        return range(start, self._size)
+
+    def spawn(self, names: list[str], job_classes: list[str] | str, sheets) -> range:
+        """Add fresh characters from an (n, 5) array of ``SHEET_STATS`` columns in bulk."""
+        sheets, job_classes = checked_sheets(names, job_classes, sheets)
+        start, stop = self._size, self._size + len(sheets)
+        self._reserve(stop)
+        for column, name in enumerate(SHEET_STATS):
+            self._columns[name][start:stop] = sheets[:, column]
+            self._columns[f"max_{name}"][start:stop] = sheets[:, column]
+        self._columns["exp"][start:stop] = 0
+        self._columns["level"][start:stop] = 1
+        self._columns["status"][start:stop] = STATUS_CODES[Status.HEALTHY]
+        self._names.extend(names)
+        self._job_classes.extend(job_classes)
+        self._size = stop
+        self.mark(slice(start, stop), ALL)
+        return range(start, stop)
+
+    def gain_exp(self, indices, amounts) -> np.ndarray:
+        """Award exp to many rows at once, see ``Character.gain_exp``.
+
+        Repeated indices accumulate. Returns levels gained for each row of ``np.unique(indices)``.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        exp = self.exp
+        np.add.at(exp, indices, amounts)
+        rows = np.unique(indices)
+        levels, exp[rows] = levels_gained_batch(self.level[rows], exp[rows])
+        self.level[rows] += levels
+        for name in ("max_strength", "max_agility", "max_intelligence", "max_defense"):
+            self._columns[name][rows] += levels
+        self.max_health[rows] += 10 * levels
+        self.mark(rows, Dirty.EXP)
+        self.mark(rows[levels > 0], LEVELED)
+        return levels
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> "CharacterView":
+        if not -self._size <= index < self._size:
+            raise IndexError(index)
+        return CharacterView(self, index % self._size)
+
+    def __iter__(self):
+        return (CharacterView(self, index) for index in range(self._size))
+
+
+# Pool column backing each stat, indexed by Stat
+STAT_COLUMNS = tuple(stat.name.lower() for stat in Stat)
+
+
+def _column(name: str, field: Dirty) -> property:
+    def fget(self):
+        return self._pool._columns[name][self._index].item()
+
+    def fset(self, value) -> None:
+        columns = self._pool._columns
+        columns[name][self._index] = value
+        dirty = columns.get("dirty")
+        if dirty is not None:
+            dirty[self._index] |= field
+
+    return property(fget, fset)
+
+
+class CharacterView(BaseCharacter):
+    """A character whose state lives in a row of a ``CharacterPool``.
+
+    Built on ``BaseCharacter`` rather than ``Character``, so a view carries
+    only its pool and row, not storage slots it would never use.
+    """
+
+    __slots__ = ("_pool", "_index", "_e")
+
+    _health = _column("health", Dirty.HEALTH)
+    _defense = _column("defense", Dirty.DEFENSE)
+    _strength = _column("strength", Dirty.STRENGTH)
+    _agility = _column("agility", Dirty.AGILITY)
+    _intelligence = _column("intelligence", Dirty.INTELLIGENCE)
+    _max_health = _column("max_health", Dirty.MAX_HEALTH)
+    _max_defense = _column("max_defense", Dirty.MAX_DEFENSE)
+    _max_strength = _column("max_strength", Dirty.MAX_STRENGTH)
+    _max_agility = _column("max_agility", Dirty.MAX_AGILITY)
+    _max_intelligence = _column("max_intelligence", Dirty.MAX_INTELLIGENCE)
+    _exp = _column("exp", Dirty.EXP)
+    _level = _column("level", Dirty.LEVEL)
+
+    def __init__(self, pool: CharacterPool, index: int) -> None:
+        self._pool = pool
+        self._index = index
+
+    @property
+    def pool(self) -> CharacterPool:
+        return self._pool
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def _name(self) -> str:
+        return self._pool.names[self._index]
+
+    @property
+    def _job_class(self) -> str:
+        return self._pool.job_classes[self._index]
+
+    @property
+    def _exp_to_next_level(self) -> int:
+        return exp_to_level_up(self._level)
+
+    @_exp_to_next_level.setter
+    def _exp_to_next_level(self, value: int) -> None:
+        # Derived from the level column, nothing to store
+        pass
+
+    @property
+    def _modifiers(self):
+        return self._pool._modifiers.get(self._index)
+
+    @_modifiers.setter
+    def _modifiers(self, value) -> None:
+        self._pool._modifiers[self._index] = value
+
+    @property
+    def _status(self) -> Status:
+        return STATUSES[self._pool._columns["status"][self._index]]
+
+    @_status.setter
+    def _status(self, value: Status) -> None:
+        columns = self._pool._columns
+        columns["status"][self._index] = STATUS_CODES[value]
+        dirty = columns.get("dirty")
+        if dirty is not None:
+            dirty[self._index] |= Dirty.STATUS
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CharacterView):
+            return self._pool is other._pool and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((id(self._pool), self._index))
@@ -0,0 +1,230 @@
+"""Versioned binary snapshots of characters and their active effects.
+
+A snapshot is a fixed header followed by one fixed-width record per
+character and then one per active effect, all little-endian::
+
+    header     magic "QRPG", version, characters, effects
+    character  name, job_class, stats (Stat order), exp, level, status
+    effect     owner row, kind, stat, name, duration, value_over_time, applied
+
+Names and job classes are stored as at most 32 bytes of UTF-8, effect names
+as at most 16; ``write_snapshot`` raises ``ValueError`` on anything longer.
+Records are laid out as NumPy structured dtypes, so ``Snapshot`` maps the
+file and reads it in place. Characters are only built when asked for.
+"""
+
+import mmap
+import struct
+
+import numpy as np
+
+from overseer import Stat, exp_to_level_up
+from role.base import Character
+from role.pool import CharacterPool, CharacterView, STATUSES, STATUS_CODES, STAT_COLUMNS
+from status import StatusEffect, Buff, Debuff
+
+MAGIC = b"QRPG"
+VERSION = 1
+HEADER = struct.Struct("<4sHxxQQ")
+
+CHARACTER_RECORD = np.dtype([
+    ("name", "S32"),
+    ("job_class", "S32"),
+    ("stats", "<i4", (len(Stat),)),
+    ("exp", "<i8"),
+    ("level", "<i4"),
+    ("status", "u1"),
+    ("pad", "V3"),
+])
+
+EFFECT_RECORD = np.dtype([
+    ("owner", "<u4"),
+    ("kind", "u1"),
+    ("stat", "u1"),
+    ("pad", "V2"),
+    ("name", "S16"),
+    ("duration", "<i4"),
+    ("value_over_time", "<i4"),
+    ("applied", "<i8"),
+])
+
+EFFECT_KINDS = (StatusEffect, Buff, Debuff)
+
+CHUNK = 1 << 16
+
+
+def _encode(text: str, size: int) -> bytes:
+    raw = text.encode("utf-8")
+    if len(raw) > size:
+        raise ValueError(f"{text!r} is {len(raw)} bytes of UTF-8, snapshots hold at most {size}")
+    return raw
+
+
+def _pool_records(pool: CharacterPool, start: int, stop: int) -> np.ndarray:
+    stop = min(stop, len(pool))
+    records = np.zeros(stop - start, CHARACTER_RECORD)
+    records["name"] = [_encode(name, 32) for name in pool.names[start:stop]]
+    records["job_class"] = [_encode(job_class, 32) for job_class in pool.job_classes[start:stop]]
+    for stat in Stat:
+        records["stats"][:, stat] = pool.column(STAT_COLUMNS[stat])[start:stop]
+    records["exp"] = pool.column("exp")[start:stop]
+    records["level"] = pool.column("level")[start:stop]
+    records["status"] = pool.column("status")[start:stop]
+    return records
+
+
+def _character_records(characters: list[Character]) -> np.ndarray:
+    records = np.zeros(len(characters), CHARACTER_RECORD)
+    records["name"] = [_encode(character.name, 32) for character in characters]
+    records["job_class"] = [_encode(character.job_class, 32) for character in characters]
+    records["stats"] = [[character.stat(stat) for stat in Stat] for character in characters]
+    records["exp"] = [character.exp for character in characters]
+    records["level"] = [character.level for character in characters]
+    records["status"] = [STATUS_CODES[character.status] for character in characters]
+    return records
+
+
+def _effect_records(effects: list[tuple[int, StatusEffect, Character]]) -> np.ndarray:
+    records = np.zeros(len(effects), EFFECT_RECORD)
+    records["owner"] = [row for row, _, _ in effects]
+    records["kind"] = [EFFECT_KINDS.index(type(effect)) for _, effect, _ in effects]
+    records["stat"] = [effect.stat for _, effect, _ in effects]
+    records["name"] = [_encode(effect.name, 16) for _, effect, _ in effects]
+    records["duration"] = [effect.duration for _, effect, _ in effects]
+    records["value_over_time"] = [effect.value_over_time for _, effect, _ in effects]
+    records["applied"] = [target.modifiers.contribution(effect) for _, effect, target in effects]
+    return records
+
+
+def write_snapshot(path, roster, effects=()) -> int:
+    """Stream ``roster`` (Characters or a CharacterPool) and its effects to ``path``.
+
+    ``effects`` yields ``(effect, target)`` pairs, e.g. ``EffectScheduler.effects()``;
+    pairs whose target is not in the roster are skipped. Returns characters written.
+    """
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        if isinstance(roster, CharacterPool):
+            for start in range(0, len(roster), CHUNK):
+                file.write(_pool_records(roster, start, start + CHUNK).tobytes())
+            written = len(roster)
+
+            def row_of(target):
+                return target.index if isinstance(target, CharacterView) and target.pool is roster else None
+        else:
+            # Keyed by the characters themselves, holding each alive so no id is reused mid-write
+            rows: dict[Character, int] = {}
+            written = 0
+            chunk = []
+            for character in roster:
+                rows[character] = written
+                written += 1
+                chunk.append(character)
+                if len(chunk) == CHUNK:
+                    file.write(_character_records(chunk).tobytes())
+                    chunk = []
+            if chunk:
+                file.write(_character_records(chunk).tobytes())
+
+            def row_of(target):
+                return rows.get(target)
+
+        count = 0
+        chunk = []
+        for effect, target in effects:
+            row = row_of(target)
+            if row is None:
+                continue
+            chunk.append((row, effect, target))
+            if len(chunk) == CHUNK:
+                file.write(_effect_records(chunk).tobytes())
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            file.write(_effect_records(chunk).tobytes())
+            count += len(chunk)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, written, count))
+    return written
+
+
+class Snapshot:
+    """Read-only, memory mapped view of a snapshot file."""
+
+    def __init__(self, path) -> None:
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, characters, effects = HEADER.unpack_from(self._map)
+        assert magic == MAGIC, f"{path} is not a snapshot"
+        assert version == VERSION, f"Unsupported snapshot version {version}"
+        self._characters = np.frombuffer(self._map, CHARACTER_RECORD, characters, HEADER.size)
+        self._effects = np.frombuffer(
+            self._map, EFFECT_RECORD, effects, HEADER.size + characters * CHARACTER_RECORD.itemsize
+        )
+
+    @property
+    def characters(self) -> np.ndarray:
+        return self._characters
+
+    @property
+    def effects(self) -> np.ndarray:
+        return self._effects
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def __getitem__(self, index: int) -> Character:
+        record = self._characters[index]
+        character = Character.__new__(Character)
+        character._assign(record["name"].decode(), record["job_class"].decode(), 0, 0, 0, 0, 0)
+        character._start()
+        for write, value in zip(character._stat_writers, record["stats"].tolist()):
+            write(character, value)
+        character._exp = int(record["exp"])
+        character._level = int(record["level"])
+        character._exp_to_next_level = exp_to_level_up(character._level)
+        character._status = STATUSES[record["status"]]
+        return character
+
+    def to_pool(self) -> CharacterPool:
+        pool = CharacterPool(len(self))
+        records = self._characters
+        count = len(records)
+        pool._names.extend(name.decode() for name in records["name"])
+        pool._job_classes.extend(job_class.decode() for job_class in records["job_class"])
+        pool._reserve(count)
+        for stat in Stat:
+            pool.column(STAT_COLUMNS[stat])[:count] = records["stats"][:, stat]
+        pool.column("exp")[:count] = records["exp"]
+        pool.column("level")[:count] = records["level"]
+        pool.column("status")[:count] = records["status"]
+        pool._size = count
+        return pool
+
+    def restore_effects(self, characters, scheduler) -> int:
+        """Schedule the saved effects onto ``characters[owner]``, returns how many."""
+        for record in self._effects:
+            kind = EFFECT_KINDS[record["kind"]]
+            stat = Stat(record["stat"]).name.lower()
+            duration, value = int(record["duration"]), int(record["value_over_time"])
+            if kind is StatusEffect:
+                effect = StatusEffect(record["name"].decode(), stat, duration, value, scheduler.clock)
+            else:
+                effect = kind(stat, duration, value, scheduler.clock)
+            target = characters[int(record["owner"])]
+            if record["applied"]:
+                target.modifiers.restore(effect, int(record["applied"]))
+            scheduler.schedule(effect, target)
+        return len(self._effects)
+
+    def close(self) -> None:
+        # Drop the array views first, mmap refuses to close while they are exported
+        self._characters = self._effects = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
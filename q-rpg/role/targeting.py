@@ -0,0 +1,59 @@
+"""Live target selection over a group of characters."""
+
+from overseer import IndexedHeap, Stat
+from role.base import Character
+from role.group import LivingGroup
+
+# Order name: (stat, highest first)
+ORDERS = {
+    "health": (Stat.HEALTH, False),
+    "defense": (Stat.DEFENSE, False),
+    "threat": (Stat.STRENGTH, True),
+}
+
+
+class TargetIndex(LivingGroup):
+    """Living members of a group kept in one heap per order in ``ORDERS``.
+
+    ``weakest("health")`` is the living member with the least health, found
+    in O(1); ties go to whoever joined first. While watching, ``STAT`` events
+    re-key a member in the heap for that stat and ``DEATH`` or ``STATUS``
+    events for ``Status.DEAD`` drop it, each in O(log n). Bulk writes to
+    ``CharacterPool`` columns emit nothing, call ``update`` or ``remove``.
+    """
+
+    def __init__(self, group=(), orders: dict[str, tuple[Stat, bool]] = None, watch: bool = False) -> None:
+        self._orders = dict(orders or ORDERS)
+        self._heaps = {name: IndexedHeap() for name in self._orders}
+        # Orders affected by each stat
+        self._by_stat = {}
+        for name, (stat, _) in self._orders.items():
+            self._by_stat.setdefault(stat, []).append(name)
+        self._watched_stats = frozenset(self._by_stat)
+        super().__init__(group, watch)
+
+    def _key(self, character: Character, order: str) -> tuple[int, int]:
+        stat, highest = self._orders[order]
+        value = character.stat(stat)
+        return -value if highest else value, self._joined[character]
+
+    def _join(self, character: Character) -> None:
+        for name, heap in self._heaps.items():
+            heap.push(character, self._key(character, name))
+
+    def _leave(self, character: Character) -> None:
+        for heap in self._heaps.values():
+            heap.remove(character)
+
+    def _restat(self, character: Character, stat: Stat | None) -> None:
+        for name in self._orders if stat is None else self._by_stat.get(stat, ()):
+            self._heaps[name].update(character, self._key(character, name))
+
+    def weakest(self, order: str = "health") -> Character | None:
+        with self._lock:
+            return self._heaps[order].peek()
+
+    def ranked(self, order: str = "health", count: int = 1) -> list[Character]:
+        """The first ``count`` members by ``order``. O(count log count)."""
+        with self._lock:
+            return self._heaps[order].smallest(count)
@@ -0,0 +1,6 @@
+"""Author: Burhan Qaddoumi - github.com/Burhan-Q"""
+
+from server.world import Session, GameServer
+from server.client import GameClient
+
+__all__ = "Session", "GameServer", "GameClient"
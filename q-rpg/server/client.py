@@ -0,0 +1,69 @@
+"""Client side of the game server, mirroring one session's state."""
+
+import asyncio
+import time
+
+import numpy as np
+
+from server import protocol
+from status import StatusArgs
+
+
+class GameClient:
+    """Joins a session and keeps ``columns``, one array per ``protocol.FIELDS`` entry, in sync."""
+
+    def __init__(self) -> None:
+        self._reader = None
+        self._writer = None
+        self.columns: dict[str, np.ndarray] = {}
+        self.tick = -1
+        # Seconds from each tick starting on the server to its message arriving here
+        self.latencies = []
+        # Microseconds the server spent on each tick before the message's
+        self.work = []
+        self.received = 0
+
+    async def connect(self, host: str = "127.0.0.1", port: int = None, path: str = None) -> "GameClient":
+        if path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(host, port)
+        return self
+
+    async def join(self, session: int) -> None:
+        self._writer.write(protocol.hello(session))
+        while await self.receive() != protocol.STATE:
+            pass
+
+    def attack(self, attacker: int, target: int) -> None:
+        self._writer.write(protocol.attack(attacker, target))
+
+    def effect(self, target: int, args: StatusArgs) -> None:
+        self._writer.write(protocol.effect(target, args))
+
+    async def drain(self) -> None:
+        await self._writer.drain()
+
+    async def receive(self) -> int:
+        """Apply the next STATE or DELTA, returns its kind."""
+        payload = await protocol.read_frame(self._reader)
+        arrived = time.time()
+        kind, tick, started, work, _ = protocol.decode_server(payload)
+        self.columns = protocol.apply(self.columns, payload)
+        self.tick = tick
+        self.received += len(payload) + protocol.LENGTH.size
+        if kind == protocol.DELTA:
+            self.latencies.append(arrived - started)
+            self.work.append(work)
+        return kind
+
+    def row(self, index: int) -> dict[str, int]:
+        return {name: int(column[index]) for name, column in self.columns.items()}
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
@@ -0,0 +1,148 @@
+"""Wire format between the game server and its clients.
+
+Every message is a frame: a little-endian u4 payload length, then the payload.
+Client payloads are one of::
+
+    HELLO   kind u1, session u4
+    ATTACK  kind u1, attacker row u4, target row u4
+    EFFECT  kind u1, target row u4, StatusArgs code u1
+
+Server payloads start with ``SERVER_HEADER`` (kind, tick, wall time the tick
+started, microseconds the previous tick took) followed by a row count and
+
+    STATE   every field of every row, one array per field in ``FIELDS`` order,
+            i8 for exp and i4 for the rest
+    DELTA   changed rows u4[n], their ``Dirty`` masks u2[n], i4 values for
+            each set bit but exp, row by row in ``FIELDS`` order, then i8
+            exp for the rows with that bit set
+
+so a delta carries only the fields that changed during the tick. Frames a
+client sends longer than its largest message are refused unread.
+"""
+
+import asyncio
+import struct
+
+import numpy as np
+
+from role.dirty import Dirty
+from role.pool import CharacterPool, STAT_COLUMNS
+from status import StatusArgs
+
+HELLO, ATTACK, EFFECT = 1, 2, 3
+STATE, DELTA = 16, 17
+
+# Pool column for each ``Dirty`` bit, lowest first
+FIELDS = STAT_COLUMNS + ("exp", "level", "status")
+assert len(FIELDS) == len(Dirty)
+
+# Exp is the one column past i4 range, it grows without bound
+EXP = FIELDS.index("exp")
+TYPES = tuple("<i8" if field == EXP else "<i4" for field in range(len(FIELDS)))
+_NARROW = np.array([field != EXP for field in range(len(FIELDS))])
+
+EFFECTS = tuple(StatusArgs)
+
+LENGTH = struct.Struct("<I")
+CLIENT = {
+    HELLO: struct.Struct("<BI"),
+    ATTACK: struct.Struct("<BII"),
+    EFFECT: struct.Struct("<BIB"),
+}
+MAX_CLIENT = max(layout.size for layout in CLIENT.values())
+SERVER_HEADER = struct.Struct("<BIdII")
+
+_BITS = np.arange(len(FIELDS), dtype=np.uint16)
+
+
+def frame(payload: bytes) -> bytes:
+    return LENGTH.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader, limit: int = None) -> bytes:
+    """Next payload from ``reader``, raises ``asyncio.IncompleteReadError`` at EOF.
+
+    Raises ``ValueError`` without reading the payload if it is longer than ``limit``.
+    """
+    (length,) = LENGTH.unpack(await reader.readexactly(LENGTH.size))
+    if limit is not None and length > limit:
+        raise ValueError(f"Frame of {length} bytes is over the {limit} byte limit")
+    return await reader.readexactly(length)
+
+
+def hello(session: int) -> bytes:
+    return frame(CLIENT[HELLO].pack(HELLO, session))
+
+
+def attack(attacker: int, target: int) -> bytes:
+    return frame(CLIENT[ATTACK].pack(ATTACK, attacker, target))
+
+
+def effect(target: int, args: StatusArgs) -> bytes:
+    return frame(CLIENT[EFFECT].pack(EFFECT, target, EFFECTS.index(args)))
+
+
+def decode_client(payload: bytes) -> tuple:
+    """``(kind, *arguments)`` of a client payload, raises ``ValueError`` if malformed."""
+    layout = CLIENT.get(payload[0]) if payload else None
+    if layout is None or len(payload) != layout.size:
+        raise ValueError(f"Malformed client message {payload[:8]!r}")
+    return layout.unpack(payload)
+
+
+def state(pool: CharacterPool, tick: int, started: float, work: int) -> bytes:
+    count = len(pool)
+    columns = b"".join(pool.column(name)[:count].astype(dtype).tobytes() for name, dtype in zip(FIELDS, TYPES))
+    return frame(SERVER_HEADER.pack(STATE, tick, started, work, count) + columns)
+
+
+def delta(pool: CharacterPool, rows, masks, tick: int, started: float, work: int) -> bytes:
+    rows = np.asarray(rows, dtype=np.intp)
+    masks = np.asarray(masks, dtype=np.uint16)
+    values = np.stack([pool.column(name)[rows] for name in FIELDS], axis=1)
+    changed = ((masks[:, None] >> _BITS) & 1).astype(bool)
+    return frame(
+        SERVER_HEADER.pack(DELTA, tick, started, work, len(rows))
+        + rows.astype("<u4").tobytes()
+        + masks.astype("<u2").tobytes()
+        + values[changed & _NARROW].astype("<i4").tobytes()
+        + values[changed[:, EXP], EXP].astype("<i8").tobytes()
+    )
+
+
+def decode_server(payload: bytes) -> tuple[int, int, float, int, int]:
+    """``(kind, tick, started, work, count)`` from a server payload's header."""
+    return SERVER_HEADER.unpack_from(payload)
+
+
+def apply(columns: dict[str, np.ndarray], payload: bytes) -> dict[str, np.ndarray]:
+    """Fold a STATE or DELTA payload into ``columns``, a mirror keyed by ``FIELDS``.
+
+    Returns the mirror, replaced wholesale by STATE or grown to fit new rows.
+    """
+    kind, _, _, _, count = decode_server(payload)
+    body = memoryview(payload)[SERVER_HEADER.size:]
+    if kind == STATE:
+        columns, offset = {}, 0
+        for name, dtype in zip(FIELDS, TYPES):
+            column = np.frombuffer(body, dtype, count, offset)
+            columns[name] = column.astype(np.int64)
+            offset += column.nbytes
+        return columns
+
+    rows = np.frombuffer(body, "<u4", count).astype(np.intp)
+    masks = np.frombuffer(body, "<u2", count, offset=4 * count)
+    changed = ((masks[:, None] >> _BITS) & 1).astype(bool)
+    narrow = changed & _NARROW
+    values = np.zeros(changed.shape, np.int64)
+    values[narrow] = np.frombuffer(body, "<i4", np.count_nonzero(narrow), 6 * count)
+    values[changed[:, EXP], EXP] = np.frombuffer(body, "<i8", offset=6 * count + 4 * np.count_nonzero(narrow))
+    size = max(len(next(iter(columns.values()), ())), int(rows.max()) + 1 if count else 0)
+    for field, name in enumerate(FIELDS):
+        column = columns.get(name, np.zeros(0, np.int64))
+        if len(column) < size:
+            column = np.concatenate((column, np.zeros(size - len(column), np.int64)))
+        selected = changed[:, field]
+        column[rows[selected]] = values[selected, field]
+        columns[name] = column
+    return columns
@@ -0,0 +1,279 @@
+"""Fixed-rate world ticks for many battles, broadcast to their clients."""
+
+import asyncio
+import time
+from collections import deque
+
+import numpy as np
+
+from role.combat import resolve_attacks
+from role.pool import CharacterPool
+from server import protocol
+from status import EffectScheduler, StatusArgs, VirtualClock, default_effect_pool
+
+# Pending connections a listener queues, enough for a burst of clients joining at once
+BACKLOG = 1024
+
+
+class Session:
+    """One battle: a change-tracked pool, its queued attacks and its effects.
+
+    Effects run on the session's own virtual clock, which each ``step``
+    advances by one tick, so a session plays out the same however late its
+    ticks actually run.
+    """
+
+    def __init__(self, pool: CharacterPool, effect_interval: float = 1.0) -> None:
+        self._pool = pool
+        self._pool.track_changes()
+        self._clock = VirtualClock()
+        self._scheduler = EffectScheduler(effect_interval, self._clock, recycle=default_effect_pool())
+        self._attacks = deque()
+        self._tick = 0
+        self._waiting = None
+        self.clients = set()
+
+    @property
+    def pool(self) -> CharacterPool:
+        return self._pool
+
+    @property
+    def clock(self) -> VirtualClock:
+        return self._clock
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    @property
+    def pending(self) -> int:
+        return len(self._attacks)
+
+    def attack(self, attacker: int, target: int) -> bool:
+        """Queue ``attacker`` to attack ``target`` next tick, in arrival order."""
+        if not (0 <= attacker < len(self._pool) and 0 <= target < len(self._pool)):
+            return False
+        self._attacks.append((attacker, target))
+        return True
+
+    def effect(self, target: int, args: StatusArgs) -> bool:
+        if not 0 <= target < len(self._pool):
+            return False
+        self._scheduler.schedule(default_effect_pool().acquire(args, self._clock), self._pool[target])
+        return True
+
+    def step(self, seconds: float) -> tuple[np.ndarray, np.ndarray]:
+        """Resolve queued attacks, run effects due within ``seconds``, returns changed rows and masks."""
+        if self._attacks:
+            attackers, targets = zip(*self._attacks)
+            self._attacks.clear()
+            resolve_attacks(self._pool, attackers, targets)
+        self._scheduler.run(until=self._clock.time() + seconds)
+        self._tick += 1
+        if self._waiting is not None:
+            self._waiting.set_result(self._tick)
+            self._waiting = None
+        return self._pool.changes()
+
+    async def next_tick(self) -> int:
+        if self._waiting is None:
+            self._waiting = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(self._waiting)
+
+
+class _Client:
+    __slots__ = ("writer", "session", "held", "actions", "counted")
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.session = None
+        # Masks of rows changed while the client was too far behind to be sent them
+        self.held = None
+        self.actions = 0
+        self.counted = -1
+
+    @property
+    def buffered(self) -> int:
+        return self.writer.transport.get_write_buffer_size()
+
+    def hold(self, rows, masks, size: int) -> None:
+        if self.held is None or len(self.held) < size:
+            held = np.zeros(size, np.uint16)
+            if self.held is not None:
+                held[:len(self.held)] = self.held
+            self.held = held
+        self.held[rows] |= masks
+
+    def release(self, rows, masks) -> tuple[np.ndarray, np.ndarray]:
+        self.held[rows] |= masks
+        held, self.held = self.held, None
+        rows = np.flatnonzero(held)
+        return rows, held[rows]
+
+
+class GameServer:
+    """Serves sessions over TCP or a Unix socket, ticking them all ``rate`` times a second.
+
+    Each tick resolves every session's queued attacks in one batch, advances
+    its effects, then sends each of its clients a single DELTA of the fields
+    that changed. The delta is encoded once per session and shared.
+
+    Backpressure works both ways. A client whose socket has more than
+    ``high_water`` bytes unsent is skipped and its changes accumulate into one
+    catch-up delta, and past ``limit`` bytes it is disconnected. A client
+    sending more than ``max_actions`` in a tick is not read from again until
+    the next tick, leaving the rest in its socket.
+    """
+
+    def __init__(
+            self,
+            rate: float = 20.0,
+            effect_interval: float = 1.0,
+            high_water: int = 1 << 18,
+            limit: int = 1 << 24,
+            max_actions: int = 1024,
+    ) -> None:
+        self._interval = 1 / rate
+        self._effect_interval = effect_interval
+        self._high_water = high_water
+        self._limit = limit
+        self._max_actions = max_actions
+        self._sessions: dict[int, Session] = {}
+        self._server = None
+        self._ticker = None
+        self._handlers = set()
+        self._tick = 0
+        self._work = 0
+        self._overruns = 0
+        self.durations = deque(maxlen=4096)
+
+    @property
+    def sessions(self) -> dict[int, Session]:
+        return self._sessions
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    def add_session(self, pool: CharacterPool) -> int:
+        session = len(self._sessions)
+        self._sessions[session] = Session(pool, self._effect_interval)
+        return session
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: str = None):
+        """Listen on ``host:port``, or the Unix socket ``path``, and start ticking. Returns the address."""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path, backlog=BACKLOG)
+        else:
+            self._server = await asyncio.start_server(self._serve, host, port, backlog=BACKLOG)
+        self._ticker = asyncio.get_running_loop().create_task(self._run())
+        return self._server.sockets[0].getsockname()
+
+    async def close(self) -> None:
+        if self._ticker is not None:
+            self._ticker.cancel()
+        if self._server is not None:
+            self._server.close()
+            for handler in self._handlers:
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "GameServer":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            started, wall = time.perf_counter(), time.time()
+            self._tick += 1
+            for session in self._sessions.values():
+                rows, masks = session.step(self._interval)
+                if session.clients:
+                    self._broadcast(session, rows, masks, wall)
+            elapsed = time.perf_counter() - started
+            self._work = int(elapsed * 1e6)
+            self.durations.append(elapsed)
+
+            deadline += self._interval
+            delay = deadline - loop.time()
+            if delay < 0:
+                # Drop the missed ticks rather than bursting to catch up
+                self._overruns += 1
+                deadline = loop.time()
+            await asyncio.sleep(max(delay, 0))
+
+    def _broadcast(self, session: Session, rows, masks, wall: float) -> None:
+        shared = None
+        for client in list(session.clients):
+            if client.writer.is_closing():
+                session.clients.discard(client)
+                continue
+            buffered = client.buffered
+            if buffered > self._limit:
+                session.clients.discard(client)
+                client.writer.close()
+            elif buffered > self._high_water:
+                client.hold(rows, masks, len(session.pool))
+            elif client.held is not None:
+                caught_up = client.release(rows, masks)
+                client.writer.write(protocol.delta(session.pool, *caught_up, session.tick, wall, self._work))
+            else:
+                if shared is None:
+                    shared = protocol.delta(session.pool, rows, masks, session.tick, wall, self._work)
+                client.writer.write(shared)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = _Client(writer)
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                message = protocol.decode_client(await protocol.read_frame(reader, protocol.MAX_CLIENT))
+                kind, session = message[0], client.session
+                if kind == protocol.HELLO:
+                    self._join(client, message[1])
+                elif session is None:
+                    raise ValueError("Send HELLO before any action")
+                elif kind == protocol.ATTACK:
+                    session.attack(*message[1:])
+                else:
+                    target, code = message[1:]
+                    if code < len(protocol.EFFECTS):
+                        session.effect(target, protocol.EFFECTS[code])
+                if session is not None:
+                    if client.counted != session.tick:
+                        client.counted, client.actions = session.tick, 0
+                    client.actions += 1
+                    if client.actions >= self._max_actions:
+                        await session.next_tick()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by ``close``; finishing quietly keeps asyncio's stream callback from logging it
+            pass
+        finally:
+            self._handlers.discard(handler)
+            if client.session is not None:
+                client.session.clients.discard(client)
+            writer.close()
+
+    def _join(self, client: _Client, number: int) -> None:
+        session = self._sessions.get(number)
+        if session is None:
+            raise ValueError(f"No session {number}")
+        if client.session is not None:
+            client.session.clients.discard(client)
+        client.session = session
+        client.held = None
+        # The full state, after which the client only misses ticks it is held back from
+        client.writer.write(protocol.state(session.pool, session.tick, time.time(), self._work))
+        session.clients.add(client)
@@ -0,0 +1,17 @@
+"""Author: Burhan Qaddoumi - github.com/Burhan-Q"""
+
+from simulation.encounters import EncounterSummary, simulate_encounters, run_encounters
+from simulation.balance import sample_sheets, sweep_sheets, archetypes, duel, win_matrix, rank_sheets, format_matrix
+
+__all__ = (
+    "EncounterSummary",
+    "simulate_encounters",
+    "run_encounters",
+    "sample_sheets",
+    "sweep_sheets",
+    "archetypes",
+    "duel",
+    "win_matrix",
+    "rank_sheets",
+    "format_matrix",
+)
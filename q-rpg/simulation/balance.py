@@ -0,0 +1,160 @@
+"""Monte Carlo class balance analysis over valid stat sheets.
+
+Duels are run as whole batches of NumPy arrays, one element per duel, under
+the scalar rules: each round any active status effect ticks first, then the
+more agile side attacks (ties settled by a coin flip per duel) followed by
+the other. Damage is strength minus defense when positive, health clamps at
+0, and a defender left at 0 health dies. As with ``StatusEffect``, every
+effect drains health. A side carrying a ``StatusArgs`` effect inflicts it
+on a landed hit with probability intelligence / 100, unless one is already
+running on the target.
+"""
+
+from itertools import product
+
+import numpy as np
+
+from overseer import SHEET_STATS, invalid_sheets, sheet_index
+from simulation.encounters import DRAW
+from status import StatusArgs
+
+HEALTH, DEFENSE, STRENGTH, AGILITY, INTELLIGENCE = range(len(SHEET_STATS))
+
+# Per StatusArgs member, in declaration order; code -1 means no effect
+EFFECTS = tuple(StatusArgs)
+EFFECT_DURATION = np.array([args.value[2] for args in EFFECTS] + [0])
+EFFECT_VALUE = np.array([args.value[3] for args in EFFECTS] + [0])
+
+
+def sample_sheets(count: int, rng: np.random.Generator) -> np.ndarray:
+    """Uniformly sample ``count`` sheets passing ``total_check`` and ``balance_check``."""
+    return sheet_index().sample(count, rng)
+
+
+def sweep_sheets(step: int = 10) -> np.ndarray:
+    """Every valid sheet whose stats are multiples of ``step``."""
+    grid = np.array(list(product(range(0, 101, step), repeat=len(SHEET_STATS) - 1)))
+    rest = 200 - grid.sum(axis=1)
+    keep = (rest >= 0) & (rest <= 100) & (rest % step == 0)
+    return np.column_stack((rest[keep], grid[keep]))
+
+
+def archetypes(sheets: np.ndarray) -> dict[str, np.ndarray]:
+    """Group sheets by their highest stat, e.g. ``"strength"`` for glass cannons."""
+    top = np.argmax(sheets, axis=1)
+    return {name: sheets[top == stat] for stat, name in enumerate(SHEET_STATS) if (top == stat).any()}
+
+
+def _effect_codes(effect, count: int) -> np.ndarray:
+    if effect is None:
+        return np.full(count, -1)
+    if isinstance(effect, StatusArgs):
+        return np.full(count, EFFECTS.index(effect))
+    return np.asarray(effect)
+
+
+def duel(a, b, rng: np.random.Generator, effect_a=None, effect_b=None, max_rounds: int = 100) -> np.ndarray:
+    """Fight ``a[i]`` against ``b[i]`` for every row, returns 0 or 1 for the winner or ``DRAW``.
+
+    ``effect_a``/``effect_b`` are a ``StatusArgs`` member, an array of indices
+    into ``EFFECTS`` (-1 for none), or ``None``.
+    """
+    a, b = np.asarray(a, np.int64), np.asarray(b, np.int64)
+    count = len(a)
+    code_a, code_b = _effect_codes(effect_a, count), _effect_codes(effect_b, count)
+
+    # Reorder every duel so side 0 moves first, stats never change so neither does damage
+    swap = (b[:, AGILITY] > a[:, AGILITY]) | ((b[:, AGILITY] == a[:, AGILITY]) & (rng.random(count) < 0.5))
+    sides = np.where(swap[None, :, None], np.stack((b, a)), np.stack((a, b)))
+    codes = np.where(swap, np.stack((code_b, code_a)), np.stack((code_a, code_b)))
+    damage = np.maximum(sides[:, :, STRENGTH] - sides[::-1, :, DEFENSE], 0)
+    chance = np.where((damage > 0) & (codes >= 0), sides[:, :, INTELLIGENCE] / 100, 0.0)
+    duration, value = EFFECT_DURATION[codes], EFFECT_VALUE[codes]
+    health = sides[:, :, HEALTH].copy()
+    ticking = np.zeros((2, count), np.int64)
+    drain = np.zeros((2, count), np.int64)
+
+    winner = np.full(count, DRAW)
+    live = np.arange(count)
+    for _ in range(max_rounds):
+        active = ticking > 0
+        health = np.where(active, np.maximum(health - drain, 0), health)
+        ticking -= active
+
+        # First mover swings, the second only if it survived
+        health[1] = np.maximum(health[1] - damage[0], 0)
+        first_wins = health[1] <= 0
+        inflict = ~ticking[1].astype(bool) & (rng.random(len(live)) < chance[0])
+        ticking[1] = np.where(inflict, duration[0], ticking[1])
+        drain[1] = np.where(inflict, value[0], drain[1])
+
+        swings = ~first_wins
+        health[0] = np.where(swings, np.maximum(health[0] - damage[1], 0), health[0])
+        second_wins = swings & (health[0] <= 0)
+        inflict = swings & ~ticking[0].astype(bool) & (rng.random(len(live)) < chance[1])
+        ticking[0] = np.where(inflict, duration[1], ticking[0])
+        drain[0] = np.where(inflict, value[1], drain[0])
+
+        winner[live[first_wins]] = 0
+        winner[live[second_wins]] = 1
+        # Neither side can hurt the other and nothing is ticking, a draw whatever is left
+        stalled = (damage == 0).all(axis=0) & (ticking == 0).all(axis=0)
+        keep = ~(first_wins | second_wins | stalled)
+        if not keep.all():
+            live = live[keep]
+            if not len(live):
+                break
+            damage, chance, duration, value = damage[:, keep], chance[:, keep], duration[:, keep], value[:, keep]
+            health, ticking, drain = health[:, keep], ticking[:, keep], drain[:, keep]
+
+    # Back to the caller's sides
+    return np.where((winner != DRAW) & swap, 1 - winner, winner)
+
+
+def win_matrix(
+        builds: dict[str, np.ndarray],
+        duels: int = 10_000,
+        seed: int = 0,
+        effects: dict[str, StatusArgs] = None,
+        max_rounds: int = 100,
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Win rate of every class (rows) against every class (columns).
+
+    Each cell fights ``duels`` random pairings of the two classes' builds in
+    one batch. Returns class names, the win-rate matrix and the draw-rate matrix.
+    """
+    for name, sheets in builds.items():
+        invalid = invalid_sheets(sheets)
+        assert not len(invalid), f"Invalid {name} sheets at rows {invalid.tolist()}"
+    effects = effects or {}
+    rng = np.random.default_rng(seed)
+    names = list(builds)
+    classes = len(names)
+    pairs = [(row, column) for row in range(classes) for column in range(classes)]
+    a, b, effect_a, effect_b = [], [], [], []
+    for row, column in pairs:
+        for picks, side, codes in ((a, row, effect_a), (b, column, effect_b)):
+            sheets = np.asarray(builds[names[side]])
+            picks.append(sheets[rng.integers(0, len(sheets), duels)])
+            codes.append(_effect_codes(effects.get(names[side]), duels))
+    winners = duel(
+        np.concatenate(a), np.concatenate(b), rng, np.concatenate(effect_a), np.concatenate(effect_b), max_rounds
+    ).reshape(classes, classes, duels)
+    return names, (winners == 0).mean(axis=2), (winners == DRAW).mean(axis=2)
+
+
+def rank_sheets(sheets, opponents: int = 1_000, seed: int = 0, max_rounds: int = 100) -> np.ndarray:
+    """Win rate of each sheet against ``opponents`` uniformly sampled valid sheets."""
+    sheets = np.asarray(sheets)
+    rng = np.random.default_rng(seed)
+    challengers = np.repeat(sheets, opponents, axis=0)
+    winners = duel(challengers, sample_sheets(len(challengers), rng), rng, max_rounds=max_rounds)
+    return (winners == 0).reshape(len(sheets), opponents).mean(axis=1)
+
+
+def format_matrix(names: list[str], rates: np.ndarray) -> str:
+    width = max(map(len, names)) + 2
+    lines = [" " * width + "".join(f"{name:>{width}}" for name in names)]
+    for name, row in zip(names, rates):
+        lines.append(f"{name:<{width}}" + "".join(f"{rate:>{width}.3f}" for rate in row))
+    return "\n".join(lines)
@@ -0,0 +1,169 @@
+"""Simulate many independent encounters across worker processes.
+
+An encounter is two teams, each an (n, 5) array of character sheets in
+``SHEET_STATS`` order. Encounters are packed into shards of flat NumPy
+arrays, so workers receive a few buffers rather than pickled Characters.
+Each shard runs all of its encounters in a single ``CharacterPool``.
+
+Every round each living character, fastest first, attacks a random living
+enemy. An encounter ends when a team is wiped out or after ``max_rounds``.
+Surviving winners split 100 exp per defeated enemy.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+import numpy as np
+
+from role.combat import resolve_attacks
+from role.pool import CharacterPool
+
+EXP_PER_KILL = 100
+DRAW = -1
+
+RESULT = np.dtype([
+    ("encounter", "<i8"),
+    ("winner", "i1"),
+    ("ticks", "<i4"),
+    ("damage", "<i8", (2,)),
+    ("exp", "<i8"),
+])
+
+
+def pack(encounters: list[tuple]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten encounters into sheets plus per-row encounter and team ids."""
+    sheets, encounter, team = [], [], []
+    for index, sides in enumerate(encounters):
+        for side, members in enumerate(sides):
+            members = np.asarray(members, dtype=np.int32).reshape(-1, 5)
+            sheets.append(members)
+            encounter.append(np.full(len(members), index, np.int32))
+            team.append(np.full(len(members), side, np.int8))
+    return np.concatenate(sheets), np.concatenate(encounter), np.concatenate(team)
+
+
+def simulate_shard(shard: int, first: int, sheets, encounter, team, seed: int, max_rounds: int) -> np.ndarray:
+    """Play out one packed shard, returns a ``RESULT`` row per encounter."""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(shard,)))
+    count = int(encounter.max()) + 1
+    pool = CharacterPool(len(sheets))
+    pool.spawn([""] * len(sheets), "", sheets)
+    group = encounter.astype(np.intp) * 2 + team
+    enemy = encounter.astype(np.intp) * 2 + (1 - team)
+
+    results = np.zeros(count, RESULT)
+    results["encounter"] = np.arange(first, first + count)
+    results["winner"] = DRAW
+    running = np.ones(count, bool)
+    for tick in range(1, max_rounds + 1):
+        living = np.flatnonzero(pool.alive & running[encounter])
+        sizes = np.bincount(group[living], minlength=2 * count)
+        by_group = living[np.argsort(group[living], kind="stable")]
+        starts = np.cumsum(sizes) - sizes
+        # Fastest first within each encounter; encounters never interact
+        attackers = living[np.lexsort((living, -pool.agility[living], encounter[living]))]
+        attackers = attackers[sizes[enemy[attackers]] > 0]
+        targets = by_group[starts[enemy[attackers]] + (rng.random(len(attackers)) * sizes[enemy[attackers]]).astype(np.intp)]
+        damage = resolve_attacks(pool, attackers, targets)
+        np.add.at(results["damage"], (encounter[attackers], team[attackers]), damage)
+
+        standing = np.bincount(group[pool.alive], minlength=2 * count).reshape(count, 2)
+        done = running & (standing == 0).any(axis=1)
+        results["ticks"][done] = tick
+        results["winner"][done & (standing[:, 0] > 0)] = 0
+        results["winner"][done & (standing[:, 1] > 0)] = 1
+        running &= ~done
+        if not running.any():
+            break
+    results["ticks"][running] = max_rounds
+
+    won = results["winner"] != DRAW
+    if won.any():
+        winning = won[encounter] & (team == results["winner"][encounter])
+        winners = np.flatnonzero(pool.alive & winning)
+        # Only the losing side's dead count, winners who fell were not kills
+        kills = np.bincount(encounter[~pool.alive & won[encounter] & ~winning], minlength=count)
+        survivors = np.bincount(encounter[winners], minlength=count)
+        share = kills[encounter[winners]] * EXP_PER_KILL // survivors[encounter[winners]]
+        pool.gain_exp(winners, share)
+        np.add.at(results["exp"], encounter[winners], share)
+    return results
+
+
+class EncounterSummary:
+    """Streaming aggregate of encounter results."""
+
+    def __init__(self) -> None:
+        self.encounters = 0
+        self.wins = [0, 0]
+        self.draws = 0
+        self.ticks = 0
+        self.damage = [0, 0]
+        self.exp = 0
+
+    def update(self, results: np.ndarray) -> None:
+        self.encounters += len(results)
+        self.wins[0] += int((results["winner"] == 0).sum())
+        self.wins[1] += int((results["winner"] == 1).sum())
+        self.draws += int((results["winner"] == DRAW).sum())
+        self.ticks += int(results["ticks"].sum())
+        self.damage[0] += int(results["damage"][:, 0].sum())
+        self.damage[1] += int(results["damage"][:, 1].sum())
+        self.exp += int(results["exp"].sum())
+
+    def asdict(self) -> dict:
+        return {
+            "encounters": self.encounters,
+            "wins": list(self.wins),
+            "draws": self.draws,
+            "mean_ticks": self.ticks / self.encounters if self.encounters else 0.0,
+            "damage": list(self.damage),
+            "exp": self.exp,
+        }
+
+    def __repr__(self) -> str:
+        return f"EncounterSummary({self.asdict()})"
+
+
+def simulate_encounters(
+        encounters,
+        seed: int = 0,
+        workers: int = None,
+        shard_size: int = 1024,
+        max_rounds: int = 100,
+):
+    """Yield a ``RESULT`` array per shard as shards finish, possibly out of order.
+
+    Shard ``k`` always holds encounters ``k * shard_size`` onwards and is seeded
+    from ``(seed, k)``, so results do not depend on worker count or timing.
+    ``workers=0`` runs inline in this process.
+    """
+    encounters = iter(encounters)
+    shards = ((index, index * shard_size, list(chunk)) for index, chunk in enumerate(
+        iter(lambda: list(islice(encounters, shard_size)), [])
+    ))
+    if workers == 0:
+        for index, first, chunk in shards:
+            yield simulate_shard(index, first, *pack(chunk), seed, max_rounds)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as executor:
+        # Keep a bounded number of shards in flight so huge inputs stream through
+        limit = 2 * workers
+        pending = set()
+        for index, first, chunk in shards:
+            pending.add(executor.submit(simulate_shard, index, first, *pack(chunk), seed, max_rounds))
+            if len(pending) >= limit:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+        for future in wait(pending).done:
+            yield future.result()
+
+
+def run_encounters(encounters, **kwargs) -> EncounterSummary:
+    summary = EncounterSummary()
+    for results in simulate_encounters(encounters, **kwargs):
+        summary.update(results)
+    return summary
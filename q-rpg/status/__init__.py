@@ -1,5 +1,31 @@
 """Author: Burhan Qaddoumi - github.com/Burhan-Q"""
 
-from effect import Status, StatusArgs, StatusEffect, Buff, Debuff
+from clock import RealClock, VirtualClock, get_clock, set_clock
+from effect import STATUS_CODES, Status, StatusArgs, StatusEffect, Modifier, Buff, Debuff
+from effect_pool import PROTOTYPES, EffectPool, default_effect_pool
+from modifiers import ModifierStack
+from scheduler import EffectScheduler, default_scheduler, live_schedulers
+from tasks import AsyncEffectRunner, default_runner
 
-__all__ = "Status", "StatusArgs", "StatusEffect", "Buff", "Debuff"
+__all__ = (
+    "STATUS_CODES",
+    "Status",
+    "StatusArgs",
+    "StatusEffect",
+    "Modifier",
+    "Buff",
+    "Debuff",
+    "PROTOTYPES",
+    "EffectPool",
+    "default_effect_pool",
+    "ModifierStack",
+    "EffectScheduler",
+    "default_scheduler",
+    "live_schedulers",
+    "AsyncEffectRunner",
+    "default_runner",
+    "RealClock",
+    "VirtualClock",
+    "get_clock",
+    "set_clock",
+)
@@ -0,0 +1,41 @@
+"""Clocks driving status effect timing."""
+
+import time
+
+
+class RealClock:
+    realtime = True
+
+    def time(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    realtime = False
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+
+    def time(self) -> float:
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        self._now += seconds
+
+    def advance_to(self, when: float) -> None:
+        self._now = max(self._now, when)
+
+
+_clock = RealClock()
+
+
+def get_clock() -> RealClock | VirtualClock:
+    return _clock
+
+
+def set_clock(clock: RealClock | VirtualClock) -> None:
+    global _clock
+    _clock = clock
@@ -1,6 +1,8 @@
-import time
 from enum import Enum
 
+from clock import VirtualClock, get_clock
+from overseer import Event, Stat, emit, listeners, resolve_stat
+
 
 class Status(Enum):
     HEALTHY = "Healthy"
@@ -15,6 +17,13 @@ class Status(Enum):
     DEBUFFED = "Debuffed"
 
 
+# Compact integer code for each status, in declaration order
+STATUS_CODES = {status: code for code, status in enumerate(Status)}
+
+# Clock of every effect released to an EffectPool, a stale reference does nothing
+RELEASED = VirtualClock()
+
+
 class StatusArgs(Enum):
     POISONED = ("Poisoned", "health", 15, 3)
     BURNED = ("Burned", "health", 9, 6)
@@ -23,14 +32,23 @@ class StatusArgs(Enum):
     CONFUSED = ("Confused", "intelligence", 25, 4)
     WEAKENED = ("Weakened", "strength", 8, 20)
 
+    # Members are singletons, so hash by identity rather than Enum's hash of the name
+    __hash__ = object.__hash__
+
 
 class StatusEffect:
-    def __init__(self, name: str, effects: str, duration: int, value_over_time:int) -> None:
+    # _pool is the EffectPool that handed the effect out, if any
+    __slots__ = ("_name", "_effects", "_stat", "_duration", "_value_over_time", "_lasts_until", "_clock", "_pool")
+
+    def __init__(self, name: str, effects: str, duration: int, value_over_time:int, clock=None) -> None:
         self._name = name
         self._effects = effects
+        self._stat = resolve_stat(effects)
         self._duration = duration
         self._value_over_time = value_over_time
         self._lasts_until = 0
+        self._clock = get_clock() if clock is None else clock
+        self._pool = None
     
     @property
     def name(self) -> str:
@@ -48,6 +66,10 @@ class StatusEffect:
     def effect(self) -> str:
         return self._effects
     
+    @property
+    def stat(self) -> Stat:
+        return self._stat
+
     @property
     def value_over_time(self) -> int:
         return self._value_over_time
@@ -56,21 +78,45 @@ class StatusEffect:
     def status(self):
         return getattr(Status, self.name.upper())
 
+    @property
+    def clock(self):
+        return self._clock
+
     @property
     def expired(self) -> bool:
-        return time.time() > self._lasts_until
+        return self._clock.time() >= self._lasts_until
+
+    def start(self, target: "Character") -> None:
+        if self._clock is RELEASED:
+            return
+        self._lasts_until = self._clock.time() + self.duration
+
+    def tick(self, target: "Character") -> bool:
+        """Apply a single tick, returns False once the effect has run its course."""
+        if self._clock is RELEASED or self.expired or self._duration <= 0 or target.status == Status.DEAD:
+            return False
+        target.set_status(self.status)
+        target.adjust_stat(Stat.HEALTH, -self.value_over_time)
+        self.duration -= 1
+        if listeners:
+            emit(Event.EFFECT_TICK, target, self, self._duration, Stat.HEALTH)
+        return True
+
+    def finish(self, target: "Character") -> None:
+        if self._clock is not RELEASED and self.expired:
+            target.set_status(Status.HEALTHY)
+
+    def cleanse(self, target: "Character") -> None:
+        """End the effect early, as if it had just expired."""
+        self._duration = 0
+        self._lasts_until = self._clock.time()
+        self.finish(target)
 
     def apply(self, target: "Character") -> None:
-        self._lasts_until = time.time() + self.duration
-        while not self.expired and self._duration > 0:
-            target.status = self.status
-            target.health -= self.value_over_time
-            self.duration -= 1
-            time.sleep(1)
-            if self.expired or target.status == Status.DEAD:
-                break
-        if self.expired and target.status != Status.DEAD:
-            target.status = Status.HEALTHY
+        self.start(target)
+        while self.tick(target):
+            self._clock.sleep(1)
+        self.finish(target)
 
     def __repr__(self) -> str:
         return f"{self.name} +++ Duration:{self.duration} +++ Effect:{self.effect}"
@@ -84,35 +130,52 @@ class StatusEffect:
         self._duration -= val
 
 
-class Buff(StatusEffect):
-    def __init__(self, attribute:str, duration: int, value: int) -> None:
-        super().__init__("BUFFED", attribute.lower(), duration, value)
-    
-    def apply(self, target: "Character") -> None:
-        if not self.expired():
-            target.status = Status.BUFFED
-            setattr(
-                target,
-                self.effect,
-                getattr(target, self.effect) + self.value_over_time
-            )
-            self._duration -= 1
-        elif self.expired() and target.status != Status.DEAD:
-            target.status = Status.HEALTHY
-
-
-class Debuff(StatusEffect):
-    def __init__(self, attribute:str, duration: int, value: int) -> None:
-        super().__init__("DEBUFFED", attribute.lower(), duration, value)
-    
+class Modifier(StatusEffect):
+    """A Buff or Debuff, adding ``_sign`` times its value to its stat each tick until it comes off."""
+
+    __slots__ = ()
+
+    _sign = 1
+
+    def tick(self, target: "Character") -> bool:
+        if self._clock is RELEASED or self.expired or self._duration <= 0:
+            return False
+        target.set_status(self.status)
+        target.modifiers.tick(self, self._sign * self.value_over_time)
+        self._duration -= 1
+        if listeners:
+            emit(Event.EFFECT_TICK, target, self, self._duration, self._stat)
+        return True
+
+    def finish(self, target: "Character") -> None:
+        """Take the contribution back out, along with the status unless another such modifier still holds it."""
+        if self._clock is RELEASED:
+            return
+        modifiers = target.modifiers
+        modifiers.remove(self)
+        status = self.status
+        if target.status == status and not any(modifier.status == status for modifier in tuple(modifiers)):
+            target.set_status(Status.HEALTHY)
+
     def apply(self, target: "Character") -> None:
-        if not self.expired():
-            target.status = Status.DEBUFFED
-            setattr(
-                target,
-                self.effect,
-                getattr(target, self.effect) - self.value_over_time
-            )
-            self._duration -= 1
-        elif self.expired() and target.status != Status.DEAD:
-            target.status = Status.HEALTHY
+        """Run a single tick, starting the effect first if it has not been."""
+        if not self._lasts_until:
+            self.start(target)
+        if not self.tick(target):
+            self.finish(target)
+
+
+class Buff(Modifier):
+    __slots__ = ()
+
+    def __init__(self, attribute:str, duration: int, value: int, clock=None) -> None:
+        super().__init__("BUFFED", attribute.lower(), duration, value, clock)
+
+
+class Debuff(Modifier):
+    __slots__ = ()
+
+    _sign = -1
+
+    def __init__(self, attribute:str, duration: int, value: int, clock=None) -> None:
+        super().__init__("DEBUFFED", attribute.lower(), duration, value, clock)
@@ -0,0 +1,93 @@
+"""Recycling of status effect instances."""
+
+from clock import get_clock
+from effect import RELEASED, StatusArgs, StatusEffect, Buff, Debuff
+from overseer import resolve_stat
+
+# Fields of a fresh effect for each StatusArgs member: name, effects, stat, duration, value over time
+PROTOTYPES = {args: (args.value[0], args.value[1], resolve_stat(args.value[1]), *args.value[2:]) for args in StatusArgs}
+
+
+class EffectPool:
+    """Hands out effects rebuilt from ``PROTOTYPES`` and takes them back once finished.
+
+    Each class keeps its own free list, up to ``capacity`` instances. Every
+    field is overwritten on acquire, and ``release`` leaves the effect on the
+    ``RELEASED`` clock, on which ``start``, ``tick`` and ``finish`` do nothing,
+    so a stale reference can neither restart it nor reset a target's status.
+    Nothing from a previous use carries over. Effects are tagged
+    with the pool they came from and ``release`` refuses any other, so
+    schedulers can hand back everything they finish. The free lists rely on
+    ``list.append``/``list.pop`` being atomic rather than taking a lock.
+
+    Only release an effect after ``finish`` or ``cleanse``, a ``Buff`` or
+    ``Debuff`` still in a target's ``ModifierStack`` would be shared by two uses.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self._capacity = capacity
+        self._free = {StatusEffect: [], Buff: [], Debuff: []}
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def available(self, kind: type = StatusEffect) -> int:
+        return len(self._free[kind])
+
+    def acquire(self, args: StatusArgs, clock=None) -> StatusEffect:
+        try:
+            effect = self._free[StatusEffect].pop()
+        except IndexError:
+            effect = StatusEffect.__new__(StatusEffect)
+        effect._name, effect._effects, effect._stat, effect._duration, effect._value_over_time = PROTOTYPES[args]
+        effect._lasts_until = 0
+        effect._clock = get_clock() if clock is None else clock
+        effect._pool = self
+        return effect
+
+    def _modifier(self, kind: type, name: str, attribute: str, duration: int, value: int, clock) -> StatusEffect:
+        try:
+            effect = self._free[kind].pop()
+        except IndexError:
+            effect = kind.__new__(kind)
+        attribute = attribute.lower()
+        effect._name, effect._effects, effect._stat = name, attribute, resolve_stat(attribute)
+        effect._duration, effect._value_over_time = duration, value
+        effect._lasts_until = 0
+        effect._clock = get_clock() if clock is None else clock
+        effect._pool = self
+        return effect
+
+    def buff(self, attribute: str, duration: int, value: int, clock=None) -> Buff:
+        return self._modifier(Buff, "BUFFED", attribute, duration, value, clock)
+
+    def debuff(self, attribute: str, duration: int, value: int, clock=None) -> Debuff:
+        return self._modifier(Debuff, "DEBUFFED", attribute, duration, value, clock)
+
+    def release(self, effect: StatusEffect) -> bool:
+        """Return a finished effect for reuse, False if not ours, already released or the pool is full."""
+        if effect._pool is not self or effect._clock is RELEASED:
+            return False
+        free = self._free[type(effect)]
+        if len(free) >= self._capacity:
+            return False
+        effect._duration = 0
+        effect._lasts_until = 0
+        effect._clock = RELEASED
+        free.append(effect)
+        return True
+
+    def clear(self) -> None:
+        for free in self._free.values():
+            free.clear()
+
+
+_default = None
+
+
+def default_effect_pool() -> EffectPool:
+    global _default
+    if _default is None:
+        _default = EffectPool()
+    return _default
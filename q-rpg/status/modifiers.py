@@ -0,0 +1,72 @@
+"""Stacked stat modifiers for a single character."""
+
+from overseer import Event, Stat, emit, listeners, lock_for
+
+
+class ModifierStack:
+    """Tracks what active Buffs and Debuffs have added to a character's stats.
+
+    The character's own stats stay the effective values, so reading them is
+    O(1) however many modifiers are active. The stack keeps the net offset per
+    stat, giving the base value back as effective minus offset, and each
+    modifier's running contribution so it can be taken back out on expiry.
+    """
+
+    __slots__ = ("_target", "_offsets", "_contributions")
+
+    def __init__(self, target: "Character") -> None:
+        self._target = target
+        self._offsets = [0] * len(Stat)
+        self._contributions: dict["StatusEffect", int] = {}
+
+    def effective(self, stat: Stat) -> int:
+        return self._target.stat(stat)
+
+    def base(self, stat: Stat) -> int:
+        return self._target.stat(stat) - self._offsets[stat]
+
+    def offset(self, stat: Stat) -> int:
+        return self._offsets[stat]
+
+    def tick(self, modifier: "StatusEffect", delta: int) -> None:
+        """Add ``delta`` to the modifier's stat and to its running contribution."""
+        stat, target = modifier.stat, self._target
+        with lock_for(target):
+            before = target.stat(stat)
+            # Health clamps at 0, so only count what actually landed
+            value = target._store(stat, before + delta)
+            applied = value - before
+            self._offsets[stat] += applied
+            self._contributions[modifier] = self._contributions.get(modifier, 0) + applied
+        if listeners:
+            emit(Event.STAT, target, value=value, aux=stat)
+
+    def contribution(self, modifier: "StatusEffect") -> int:
+        return self._contributions.get(modifier, 0)
+
+    def restore(self, modifier: "StatusEffect", applied: int) -> None:
+        """Re-register a contribution already present in the stats, e.g. after loading a snapshot."""
+        with lock_for(self._target):
+            self._offsets[modifier.stat] += applied - self._contributions.get(modifier, 0)
+            self._contributions[modifier] = applied
+
+    def remove(self, modifier: "StatusEffect") -> None:
+        """Take a modifier's whole contribution back out of its stat."""
+        stat, target = modifier.stat, self._target
+        with lock_for(target):
+            applied = self._contributions.pop(modifier, 0)
+            if not applied:
+                return
+            value = target._store(stat, target.stat(stat) - applied)
+            self._offsets[stat] -= applied
+        if listeners:
+            emit(Event.STAT, target, value=value, aux=stat)
+
+    def __contains__(self, modifier: "StatusEffect") -> bool:
+        return modifier in self._contributions
+
+    def __iter__(self):
+        return iter(self._contributions)
+
+    def __len__(self) -> int:
+        return len(self._contributions)
@@ -0,0 +1,139 @@
+"""Single threaded scheduler driving status effect ticks."""
+
+import heapq
+import itertools
+import threading
+import time
+import weakref
+
+from clock import get_clock
+from effect import StatusEffect
+from overseer import Event, emit, listeners
+
+# Every scheduler still referenced, the default one and any a Session owns
+_live = weakref.WeakSet()
+
+
+class EffectScheduler:
+    def __init__(self, interval: float = 1.0, clock=None, recycle=None) -> None:
+        self._interval = interval
+        self._clock = get_clock() if clock is None else clock
+        # An EffectPool taking back effects once they finish
+        self._recycle = recycle
+        self._queue: list[tuple[float, int, StatusEffect, "Character"]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Condition()
+        self._thread = None
+        _live.add(self)
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def clock(self):
+        return self._clock
+
+    @property
+    def active(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def effects(self) -> list[tuple[StatusEffect, "Character"]]:
+        with self._lock:
+            return [(effect, target) for _, _, effect, target in self._queue]
+
+    def schedule(self, effect: StatusEffect, target: "Character") -> None:
+        assert effect.clock is self._clock, f"{effect!r} runs on another clock than this scheduler"
+        effect.start(target)
+        with self._lock:
+            heapq.heappush(self._queue, (self._clock.time(), next(self._counter), effect, target))
+            self._lock.notify()
+        if self._clock.realtime:
+            self._ensure_running()
+
+    def drain(self) -> int:
+        """Cleanse every queued effect without ticking it, returns how many were dropped."""
+        with self._lock:
+            queue, self._queue = self._queue, []
+        for _, _, effect, target in queue:
+            effect.cleanse(target)
+            if self._recycle is not None:
+                self._recycle.release(effect)
+        return len(queue)
+
+    def run_pending(self, now: float = None) -> int:
+        """Tick every effect due at ``now``, returns the number of ticks run."""
+        started = time.perf_counter_ns() if listeners else 0
+        now = self._clock.time() if now is None else now
+        due = []
+        with self._lock:
+            while self._queue and self._queue[0][0] <= now:
+                due.append(heapq.heappop(self._queue))
+        requeue = []
+        for when, seq, effect, target in due:
+            if effect.tick(target):
+                requeue.append((when + self._interval, seq, effect, target))
+            else:
+                effect.finish(target)
+                if self._recycle is not None:
+                    self._recycle.release(effect)
+        if requeue:
+            with self._lock:
+                for entry in requeue:
+                    heapq.heappush(self._queue, entry)
+        if listeners and due:
+            emit(Event.TICK, self, value=time.perf_counter_ns() - started, aux=min(len(due), 255))
+        return len(due)
+
+    def run(self, until: float = None) -> int:
+        """Jump a virtual clock from event to event until idle or ``until``, returns ticks run."""
+        ticks = 0
+        while self._queue:
+            when = self._queue[0][0]
+            if until is not None and when > until:
+                break
+            self._clock.advance_to(when)
+            ticks += self.run_pending()
+        if until is not None:
+            self._clock.advance_to(until)
+        return ticks
+
+    def _ensure_running(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue:
+                    self._lock.wait()
+                delay = self._queue[0][0] - self._clock.time()
+                if delay > 0:
+                    self._lock.wait(delay)
+                    continue
+            self.run_pending()
+
+
+def live_schedulers() -> list[EffectScheduler]:
+    """Schedulers still in use, without creating or replacing the default one."""
+    return list(_live)
+
+
+_default = None
+
+
+def default_scheduler() -> EffectScheduler:
+    """The scheduler on the current clock, a clock change cleanses whatever the old one had queued."""
+    global _default
+    if _default is None or _default.clock is not get_clock():
+        if _default is not None:
+            _default.drain()
+        _default = EffectScheduler()
+    return _default
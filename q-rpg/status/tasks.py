@@ -0,0 +1,87 @@
+"""Run status effects as asyncio tasks."""
+
+import asyncio
+
+from effect import StatusEffect
+
+
+class AsyncEffectRunner:
+    """Runs each effect as a task on the running event loop, ticking every ``interval`` seconds.
+
+    Tasks are tracked per target so an effect can be cleansed, or everything on
+    a target cancelled when it dies.
+    """
+
+    def __init__(self, interval: float = 1.0, recycle=None) -> None:
+        self._interval = interval
+        # An EffectPool taking back effects once they finish or are cancelled
+        self._recycle = recycle
+        self._tasks: dict["Character", dict[StatusEffect, asyncio.Task]] = {}
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def active(self) -> int:
+        return sum(len(tasks) for tasks in self._tasks.values())
+
+    def start(self, effect: StatusEffect, target: "Character") -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(self._run(effect, target))
+        self._tasks.setdefault(target, {})[effect] = task
+        task.add_done_callback(lambda _: self._forget(effect, target))
+        return task
+
+    async def _run(self, effect: StatusEffect, target: "Character") -> None:
+        effect.start(target)
+        try:
+            while effect.tick(target):
+                await asyncio.sleep(self._interval)
+        except asyncio.CancelledError:
+            effect.cleanse(target)
+            self._release(effect)
+            raise
+        effect.finish(target)
+        self._release(effect)
+
+    def _release(self, effect: StatusEffect) -> None:
+        if self._recycle is not None:
+            self._recycle.release(effect)
+
+    def _forget(self, effect: StatusEffect, target: "Character") -> None:
+        tasks = self._tasks.get(target)
+        if tasks is not None:
+            tasks.pop(effect, None)
+            if not tasks:
+                del self._tasks[target]
+
+    def effects(self, target: "Character") -> list[StatusEffect]:
+        return list(self._tasks.get(target, ()))
+
+    def cleanse(self, effect: StatusEffect, target: "Character") -> bool:
+        task = self._tasks.get(target, {}).get(effect)
+        if task is None:
+            return False
+        return task.cancel()
+
+    def cancel_target(self, target: "Character") -> int:
+        """Cancel every effect running on ``target``, returns how many were cancelled."""
+        return sum(task.cancel() for task in list(self._tasks.get(target, {}).values()))
+
+    async def wait(self) -> None:
+        """Wait until no effects are running."""
+        while self._tasks:
+            await asyncio.gather(
+                *(task for tasks in list(self._tasks.values()) for task in list(tasks.values())),
+                return_exceptions=True,
+            )
+
+
+_default = None
+
+
+def default_runner() -> AsyncEffectRunner:
+    global _default
+    if _default is None:
+        _default = AsyncEffectRunner()
+    return _default
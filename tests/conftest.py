@@ -0,0 +1,37 @@
+"""Put the q-rpg packages on the import path the way the benchmarks do, and share character factories."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "q-rpg"
+for path in (SRC / "status", SRC / "overseer", SRC):
+    sys.path.insert(0, str(path))
+
+from role.base import Character, CharacterAttributes  # noqa: E402
+
+
+def make_character(name: str = "Dummy", job_class: str = "Tester", **stats) -> Character:
+    """A fresh level 1 Character, ``stats`` overriding the ``CharacterAttributes`` defaults."""
+    return Character(CharacterAttributes(name, job_class, **stats))
+
+
+def make_roster(count: int, prefix: str = "C") -> list[Character]:
+    """``count`` default Characters named ``C0``, ``C1``..."""
+    return [make_character(f"{prefix}{number}") for number in range(count)]
+
+
+@pytest.fixture
+def character() -> Character:
+    return make_character()
+
+
+@pytest.fixture(name="make_character")
+def make_character_fixture():
+    return make_character
+
+
+@pytest.fixture(name="make_roster")
+def make_roster_fixture():
+    return make_roster
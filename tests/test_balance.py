@@ -0,0 +1,37 @@
+import numpy as np
+
+from overseer import sheet_index
+from role.base import Character
+from simulation.balance import AGILITY, duel, sample_sheets
+from simulation.encounters import DRAW
+from status import Status
+
+
+def scalar_duel(first, second, max_rounds: int = 100) -> int:
+    """Winner of ``first`` moving before ``second`` under ``Character.attack``, 0, 1 or ``DRAW``."""
+    first, second = Character.spawn(["First", "Second"], "Duelist", [first, second])
+    for _ in range(max_rounds):
+        first.attack(second)
+        if second.status == Status.DEAD:
+            return 0
+        second.attack(first)
+        if first.status == Status.DEAD:
+            return 1
+    return DRAW
+
+
+def test_duels_follow_the_scalar_rules():
+    rng = np.random.default_rng(0)
+    tied = sheet_index().where(agility=(50, 50))
+    a = np.concatenate((sample_sheets(2700, rng), tied.sample(300, rng)))
+    b = np.concatenate((sample_sheets(2700, rng), tied.sample(300, rng)))
+    winners = duel(a, b, rng)
+    for first, second, winner in zip(a.tolist(), b.tolist(), winners.tolist()):
+        # Ties in agility are settled by a coin flip, so either order may have moved first
+        outcomes = set()
+        if first[AGILITY] >= second[AGILITY]:
+            outcomes.add(scalar_duel(first, second))
+        if second[AGILITY] >= first[AGILITY]:
+            result = scalar_duel(second, first)
+            outcomes.add(result if result == DRAW else 1 - result)
+        assert winner in outcomes
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from role.combat import resolve_attacks
+from role.pool import CharacterPool
+from status import Status
+
+
+def _fighters(rng, count, make_character):
+    fighters = []
+    for number in range(count):
+        character = make_character(f"F{number}")
+        character.health = int(rng.integers(1, 120))
+        character.strength = int(rng.integers(0, 80))
+        character.defense = int(rng.integers(0, 40))
+        if rng.random() < 0.2:
+            character.health = 0
+            character.status = Status.DEAD
+        fighters.append(character)
+    return fighters
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_attacking_one_pair_at_a_time(seed, make_character):
+    rng = np.random.default_rng(seed)
+    count = int(rng.integers(1, 8))
+    fighters = _fighters(rng, count, make_character)
+    pairs = int(rng.integers(0, 24))
+    attackers = rng.integers(0, count, pairs)
+    targets = rng.integers(0, count, pairs)
+    # Make sure self-targets and the same pair twice in a round turn up
+    if pairs >= 2:
+        targets[0] = attackers[0]
+        attackers[-1], targets[-1] = attackers[1], targets[1]
+
+    pool = CharacterPool(count)
+    for character in fighters:
+        pool.add(character)
+    expected = []
+    for attacker, target in zip(attackers, targets):
+        attacker, target = fighters[attacker], fighters[target]
+        alive = attacker.status != Status.DEAD
+        expected.append(max(attacker.strength - target.defense, 0) if alive else 0)
+        attacker.attack(target)
+
+    damage = resolve_attacks(pool, attackers, targets)
+    assert damage.tolist() == expected
+    assert pool.health.tolist() == [character.health for character in fighters]
+    assert pool.alive.tolist() == [character.status != Status.DEAD for character in fighters]
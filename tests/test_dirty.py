@@ -0,0 +1,23 @@
+from overseer import listeners
+from role.dirty import ChangeTracker, Dirty, changed_fields
+from status import STATUS_CODES, Status
+
+
+def test_tracks_only_while_watching(character):
+    tracker = ChangeTracker([character])
+    character.strength = 30
+    assert not tracker.changes()
+    with tracker:
+        character.defend(40)
+        character.exp = 5
+    assert tracker not in listeners
+    masks = tracker.changes()
+    assert masks == {character: Dirty.HEALTH | Dirty.EXP}
+    assert changed_fields(character, masks[character]) == {"health": 85, "exp": 5}
+
+
+def test_assigning_status_marks_it(character):
+    with ChangeTracker([character]) as tracker:
+        character.status = Status.DEAD
+    assert tracker.changes() == {character: Dirty.STATUS}
+    assert changed_fields(character, Dirty.STATUS) == {"status": STATUS_CODES[Status.DEAD]}
@@ -0,0 +1,39 @@
+from status import Buff, EffectPool, EffectScheduler, Status, StatusArgs, VirtualClock
+
+
+def test_release_only_takes_back_its_own_effects():
+    clock = VirtualClock()
+    pool, other = EffectPool(), EffectPool()
+    effect = pool.acquire(StatusArgs.BURNED, clock)
+    assert not other.release(effect)
+    assert not pool.release(Buff("strength", 2, 3, clock))
+    assert pool.release(effect)
+    assert not pool.release(effect)
+    assert pool.available() == 1
+
+
+def test_scheduler_recycles_only_pooled_effects(make_roster):
+    clock = VirtualClock()
+    pool = EffectPool()
+    scheduler = EffectScheduler(clock=clock, recycle=pool)
+    poisoned, buffed = make_roster(2)
+    scheduler.schedule(pool.acquire(StatusArgs.POISONED, clock), poisoned)
+    scheduler.schedule(Buff("strength", 2, 3, clock), buffed)
+    scheduler.run()
+    assert pool.available() == 1
+    assert pool.available(Buff) == 0
+
+
+def test_stale_released_buff_leaves_the_target_alone(character):
+    clock = VirtualClock()
+    pool = EffectPool()
+    buff = pool.buff("strength", 1, 3, clock)
+    buff.apply(character)
+    buff.cleanse(character)
+    assert pool.release(buff)
+    character.set_status(Status.POISONED)
+    buff.apply(character)
+    buff.cleanse(character)
+    assert character.status == Status.POISONED
+    assert character.strength == 25
+    assert buff not in character.modifiers
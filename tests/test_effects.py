@@ -0,0 +1,41 @@
+from status import Buff, Debuff, Status, VirtualClock
+
+
+def test_apply_buff_starts_and_ticks(character):
+    character.apply_buff(Buff("strength", 3, 10))
+    assert character.strength == 35
+    assert character.status == Status.BUFFED
+
+
+def test_apply_debuff_starts_and_ticks(character):
+    character.apply_debuff(Debuff("Agility", 3, 5))
+    assert character.agility == 20
+
+
+def test_modifier_runs_its_course_then_comes_off(character):
+    clock = VirtualClock()
+    buff = Buff("defense", 2, 4, clock)
+    for _ in range(3):
+        buff.apply(character)
+        clock.sleep(1)
+    assert character.defense == 25
+    assert len(character.modifiers) == 0
+
+
+def test_status_comes_off_with_the_contribution(character):
+    clock = VirtualClock()
+    buff = Buff("defense", 2, 4, clock)
+    for _ in range(3):
+        buff.apply(character)
+    assert character.defense == 25
+    assert character.status == Status.HEALTHY
+
+
+def test_status_stays_while_another_modifier_holds_it(character):
+    clock = VirtualClock()
+    short, long = Buff("defense", 1, 4, clock), Buff("strength", 3, 2, clock)
+    long.apply(character)
+    short.apply(character)
+    short.apply(character)
+    assert character.status == Status.BUFFED
+    assert character.defense == 25 and character.strength == 27
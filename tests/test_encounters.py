@@ -0,0 +1,14 @@
+from simulation.encounters import EXP_PER_KILL, simulate_encounters
+
+# A tank the enemy cannot hurt, beside a fast member any hit kills
+WINNERS = [[50, 50, 100, 0, 0], [1, 0, 0, 100, 99]]
+# One fast enemy that kills the fragile member if it picks them
+LOSERS = [[1, 0, 40, 100, 59]]
+
+
+def test_winners_who_fell_are_not_kills():
+    results = next(simulate_encounters([(WINNERS, LOSERS)] * 64, seed=1, workers=0))
+    assert (results["winner"] == 0).all()
+    # Some encounters lost their fragile member, yet each only killed one enemy
+    assert (results["damage"][:, 1] > 0).any()
+    assert (results["exp"] == EXP_PER_KILL).all()
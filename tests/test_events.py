@@ -0,0 +1,30 @@
+import threading
+
+from overseer import Event, Stat, subscribe, unsubscribe
+from status import Buff, VirtualClock
+
+
+def without_deadlock(action) -> bool:
+    worker = threading.Thread(target=action, daemon=True)
+    worker.start()
+    worker.join(timeout=2)
+    return not worker.is_alive()
+
+
+def test_listeners_may_touch_the_character_they_hear_about(character):
+    seen = []
+
+    def listener(kind, actor, target, value, aux):
+        if actor is character and (kind == Event.DAMAGE or (kind == Event.STAT and aux != Stat.INTELLIGENCE)):
+            seen.append(kind)
+            # Takes the character's lock, which must be free by now
+            character.adjust_stat("intelligence", 0)
+
+    subscribe(listener)
+    try:
+        assert without_deadlock(lambda: character.adjust_stat("strength", 1))
+        assert without_deadlock(lambda: character.defend(60))
+        assert without_deadlock(lambda: Buff("agility", 2, 3, VirtualClock()).apply(character))
+    finally:
+        unsubscribe(listener)
+    assert Event.DAMAGE in seen
@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+
+from role.base import Character
+
+
+def test_distribute_numpy_scalar_to_everyone(make_roster):
+    members = make_roster(3)
+    Character.distribute_exp(members, np.int64(7))
+    assert [member.exp for member in members] == [7, 7, 7]
+    assert all(type(member.exp) is int for member in members)
+
+
+def test_distribute_rejects_mismatched_awards(make_roster):
+    with pytest.raises(AssertionError):
+        Character.distribute_exp(make_roster(3), [1, 2])
@@ -0,0 +1,38 @@
+from overseer import listeners
+import pytest
+
+from role.initiative import InitiativeQueue
+from status import Status
+
+
+@pytest.fixture
+def fighters(make_character):
+    return [
+        make_character("Slow", agility=10, intelligence=40),
+        make_character("Quick", agility=40, intelligence=10),
+    ]
+
+
+def test_unwatched_until_asked(fighters):
+    queue = InitiativeQueue(fighters)
+    assert queue not in listeners
+    assert [character.name for character in queue.upcoming()] == ["Quick", "Slow"]
+
+
+def test_watching_only_inside_the_block(fighters):
+    slow, quick = fighters
+    with InitiativeQueue([slow, quick]) as queue:
+        assert queue.watching
+        slow.agility = 90
+        assert queue.upcoming()[0] is slow
+        quick.defend(500)
+        assert quick not in queue
+    assert queue not in listeners
+
+
+def test_assigning_dead_status_drops_combatant(fighters):
+    slow, quick = fighters
+    with InitiativeQueue(fighters) as queue:
+        slow.status = Status.DEAD
+        assert slow not in queue
+        assert queue.upcoming() == [quick]
@@ -0,0 +1,62 @@
+import pytest
+
+from items import BaseItem, CompactInventory, ItemCatalog
+from items.inventory import Inventory
+
+
+def test_add_leaves_the_argument_alone():
+    potion = BaseItem("Potion", 10, 5, "health")
+    potion.count = 3
+    inventory = Inventory()
+    assert inventory.add(potion, 2) == 2
+    assert potion.count == 3
+    inventory.add(potion)
+    assert inventory.count("Potion") == 5
+    assert potion.count == 3
+    assert inventory.get("Potion") is not potion
+
+
+def test_removing_a_stack_keeps_the_argument():
+    potion = BaseItem("Potion", 10, 5, "health")
+    inventory = Inventory()
+    inventory.add(potion, 4)
+    inventory.remove("Potion", 3)
+    assert potion.count == 1
+    assert inventory.count("Potion") == 1
+
+
+def test_catalog_interns_one_definition_per_name():
+    catalog = ItemCatalog()
+    potion = catalog.define("Potion", 10, 5, "health")
+    assert catalog.intern(BaseItem("Potion", 10, 5, "health")) is potion
+    elixir, = catalog.load([("Elixir", 30, 8, "intelligence")])
+    assert catalog[0] is catalog["Potion"] is potion
+    assert catalog.by_id(elixir.id) is catalog.by_name("Elixir") is elixir
+    assert len(catalog) == 2 and "Elixir" in catalog and catalog.get("Ether") is None
+
+
+def test_catalog_refuses_conflicting_definitions():
+    catalog = ItemCatalog()
+    catalog.define("Potion", 10, 5, "health")
+    with pytest.raises(AssertionError, match="already defined differently"):
+        catalog.define("Potion", 10, 50, "health")
+
+
+def test_compact_inventory_stacks_by_catalog_id():
+    catalog = ItemCatalog()
+    inventory = CompactInventory(capacity=2, stack_limit=5, catalog=catalog)
+    potion, ether = BaseItem("Potion", 10, 5, "health"), BaseItem("Ether", 12, 4, "intelligence")
+    assert inventory.add(potion, 3) == 3
+    assert inventory.add(potion, 4) == 2
+    assert inventory.add(ether) == 1
+    assert inventory.full and inventory.add(BaseItem("Bomb", 50, 20, "strength")) == 0
+    assert "Bomb" not in catalog
+    assert inventory.names() == ["Potion", "Ether"] and inventory.total == 6
+    assert [item.name for item in inventory.with_effect("Health")] == ["Potion"]
+
+    stack = inventory.get("Potion")
+    assert stack.count == 5 and stack is not inventory.get("Potion")
+    assert inventory.remove("Potion", 9) == 5
+    assert "Potion" not in inventory and inventory.with_effect("health") == []
+    assert inventory.count("Potion") == 0 and inventory.get("Potion") is None
+    assert len(inventory) == 1
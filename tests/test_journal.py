@@ -0,0 +1,47 @@
+import threading
+
+from journal.log import EventLogReader, EventLogWriter, replay
+from overseer import Event
+
+
+def test_replay_reproduces_levels(tmp_path, make_roster):
+    path = tmp_path / "events.qlog"
+    characters = make_roster(2)
+    with EventLogWriter(path, characters):
+        characters[0].level = 7
+        characters[1].gain_exp(5_000)
+        characters[0].attack(characters[1])
+    fresh = make_roster(2)
+    replay(path, fresh)
+    assert [character.level for character in fresh] == [character.level for character in characters]
+    assert fresh[1].health == characters[1].health
+
+
+def test_concurrent_flushes_write_each_event_once(tmp_path, make_roster):
+    path = tmp_path / "events.qlog"
+    characters = make_roster(1)
+    writer = EventLogWriter(path, characters)
+    for value in range(20_000):
+        writer(Event.EXP, characters[0], None, value, 0)
+    flushes = [threading.Thread(target=writer.flush) for _ in range(4)]
+    for flush in flushes:
+        flush.start()
+    for flush in flushes:
+        flush.join()
+    writer.close()
+    values = [record[4] for record in EventLogReader(path)]
+    assert values == list(range(20_000))
+
+
+def test_replay_skips_outsiders(tmp_path, make_character, make_roster):
+    path = tmp_path / "events.qlog"
+    hero = make_character("Hero")
+    outsider = make_character("Outsider", defense=15, strength=35)
+    with EventLogWriter(path, [hero]):
+        outsider.attack(hero)
+        hero.attack(outsider)
+        hero.strength = 30
+    fresh = make_roster(1)
+    # The outsider's attack survives as the hero's health write
+    assert replay(path, fresh) == 2
+    assert (fresh[0].health, fresh[0].strength) == (hero.health, 30)
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+from journal.metrics import Metrics
+from overseer import Event
+from role.pool import CharacterPool
+from server.world import Session
+from status import EffectPool, StatusArgs, VirtualClock, default_scheduler, get_clock, set_clock
+
+
+def test_damage_counts_health_actually_lost(character):
+    metrics = Metrics()
+    metrics.enable()
+    try:
+        character.defend(500)
+        character.defend(500)
+    finally:
+        metrics.disable()
+    assert metrics.snapshot()["damage_total"] == 100
+
+
+def test_level_ups_are_not_capped(character):
+    metrics = Metrics()
+    metrics.enable()
+    try:
+        character.level = 301
+    finally:
+        metrics.disable()
+    assert metrics.snapshot()["level_ups_total"] == 300
+
+
+def test_counters_add_up_across_threads():
+    metrics = Metrics()
+
+    def attack():
+        for _ in range(20_000):
+            metrics(Event.ATTACK, None, None, 0, 0)
+
+    threads = [threading.Thread(target=attack) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.snapshot()["attacks_total"] == 80_000
+
+
+def test_async_attacks_are_counted(make_roster):
+    attacker, target = make_roster(2)
+    metrics = Metrics()
+    metrics.enable()
+    try:
+        asyncio.run(attacker.attack_async(target))
+    finally:
+        metrics.disable()
+    assert metrics.snapshot()["attacks_total"] == 1
+
+
+def test_gauges_count_sessions_and_leave_the_default_scheduler(make_roster):
+    original = get_clock()
+    set_clock(VirtualClock())
+    try:
+        scheduler = default_scheduler()
+        pool = CharacterPool(2)
+        for character in make_roster(2):
+            pool.add(character)
+        session = Session(pool)
+        before = Metrics().gauges()["active_effects"]
+        scheduler.schedule(EffectPool().acquire(StatusArgs.POISONED, scheduler.clock), pool[0])
+        session.effect(1, StatusArgs.POISONED)
+        set_clock(VirtualClock())
+        assert Metrics().gauges()["active_effects"] == before + 2
+        assert scheduler.active == 1
+    finally:
+        scheduler.drain()
+        set_clock(original)
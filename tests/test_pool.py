@@ -0,0 +1,18 @@
+import sys
+
+from role.pool import CharacterPool
+
+
+def test_views_are_lighter_than_characters_and_act_alike(character, make_character):
+    pool = CharacterPool(2)
+    pool.add(make_character("Row"))
+    view = pool[0]
+    assert sys.getsizeof(view) < sys.getsizeof(character)
+
+    character.attack(view)
+    view.attack(character)
+    assert pool.health[0] == character.health == 100
+    view.gain_exp(1_000)
+    copy = CharacterPool(1)
+    copy.add(view)
+    assert copy[0].level == view.level > 1
@@ -0,0 +1,56 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from overseer import sheet_index
+from role.dirty import Dirty
+from role.pool import CharacterPool
+from server import protocol
+
+
+def payload(message: bytes) -> bytes:
+    return message[protocol.LENGTH.size:]
+
+
+def pool(count: int = 6) -> CharacterPool:
+    characters = CharacterPool(count)
+    characters.spawn([""] * count, "", sheet_index().sample(count, np.random.default_rng(0)))
+    return characters
+
+
+def mirrors(characters: CharacterPool, columns: dict) -> bool:
+    return all(np.array_equal(columns[name], characters.column(name)[:len(characters)]) for name in protocol.FIELDS)
+
+
+def test_state_then_deltas_mirror_the_pool():
+    characters = pool()
+    columns = protocol.apply({}, payload(protocol.state(characters, 1, 0.0, 0)))
+    assert mirrors(characters, columns)
+
+    characters.column("strength")[2] = 77
+    # Past i4, as a long-lived character's exp gets
+    characters.column("exp")[4] = 5_000_000_000
+    characters.column("level")[4] = 40
+    rows, masks = [2, 4], [Dirty.STRENGTH, Dirty.EXP | Dirty.LEVEL]
+    message = payload(protocol.delta(characters, rows, masks, 2, 0.0, 0))
+    assert protocol.decode_server(message)[0] == protocol.DELTA
+    columns = protocol.apply(columns, message)
+    assert mirrors(characters, columns)
+    assert columns["exp"][4] == 5_000_000_000
+
+
+def test_client_messages_round_trip():
+    assert protocol.decode_client(payload(protocol.attack(3, 4))) == (protocol.ATTACK, 3, 4)
+    assert protocol.decode_client(payload(protocol.hello(7))) == (protocol.HELLO, 7)
+
+
+def test_oversized_client_frames_are_refused_unread():
+    async def read(data: bytes) -> bytes:
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        return await protocol.read_frame(reader, protocol.MAX_CLIENT)
+
+    assert asyncio.run(read(protocol.attack(1, 2))) == payload(protocol.attack(1, 2))
+    with pytest.raises(ValueError):
+        asyncio.run(read(protocol.LENGTH.pack(1 << 31)))
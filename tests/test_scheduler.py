@@ -0,0 +1,28 @@
+import pytest
+
+from status import Buff, EffectScheduler, RealClock, VirtualClock, default_scheduler, get_clock, set_clock
+
+
+def test_schedule_rejects_another_clock(character):
+    scheduler = EffectScheduler(clock=VirtualClock())
+    with pytest.raises(AssertionError):
+        scheduler.schedule(Buff("strength", 3, 5, VirtualClock()), character)
+
+
+def test_clock_change_cleanses_the_old_queue(character):
+    previous = get_clock()
+    clock = VirtualClock()
+    set_clock(clock)
+    try:
+        scheduler = default_scheduler()
+        base = character.strength
+        scheduler.schedule(Buff("strength", 3, 5), character)
+        scheduler.run_pending()
+        assert character.strength == base + 5
+        set_clock(RealClock())
+        assert default_scheduler() is not scheduler
+        assert scheduler.active == 0
+        assert character.strength == base
+        assert not character.modifiers
+    finally:
+        set_clock(previous)
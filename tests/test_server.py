@@ -0,0 +1,83 @@
+import asyncio
+
+import numpy as np
+
+from role.dirty import Dirty
+from server import GameClient, GameServer, protocol
+from server.world import _Client
+from test_protocol import mirrors, payload, pool
+
+
+def test_client_mirrors_a_live_session():
+    async def play():
+        characters = pool()
+        characters.column("strength")[0] = 200
+        health = int(characters.health[1])
+        async with GameServer(rate=200) as server:
+            number = server.add_session(characters)
+            session = server.sessions[number]
+            _, port = await server.start()
+            client = await GameClient().connect(port=port)
+            try:
+                await client.join(number)
+                assert mirrors(characters, client.columns)
+                client.attack(0, 1)
+                await client.drain()
+                # Until the tick that resolved the attack, and any after it, have arrived
+                while characters.health[1] == health or client.tick < session.tick:
+                    await asyncio.wait_for(client.receive(), 5)
+                assert client.row(1)["health"] < health
+                assert mirrors(characters, client.columns)
+            finally:
+                await client.close()
+
+    asyncio.run(play())
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.buffered = 0
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffered
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.transport = _Transport()
+        self.sent = []
+        self.closed = False
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def write(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_slow_clients_are_held_then_caught_up_or_dropped():
+    characters = pool()
+    server = GameServer(high_water=10, limit=100)
+    session = server.sessions[server.add_session(characters)]
+    columns = protocol.apply({}, payload(protocol.state(characters, 0, 0.0, 0)))
+    writer = _Writer()
+    client = _Client(writer)
+    session.clients.add(client)
+
+    writer.transport.buffered = 50
+    characters.column("strength")[1] = 90
+    server._broadcast(session, np.array([1]), np.array([Dirty.STRENGTH], np.uint16), 0.0)
+    assert not writer.sent and client.held is not None
+
+    writer.transport.buffered = 0
+    characters.column("health")[3] = 12
+    server._broadcast(session, np.array([3]), np.array([Dirty.HEALTH], np.uint16), 0.0)
+    assert len(writer.sent) == 1 and client.held is None
+    assert mirrors(characters, protocol.apply(columns, payload(writer.sent[0])))
+
+    writer.transport.buffered = 200
+    server._broadcast(session, np.array([], np.intp), np.array([], np.uint16), 0.0)
+    assert writer.closed and client not in session.clients
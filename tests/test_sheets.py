@@ -0,0 +1,39 @@
+import numpy as np
+
+from overseer import SHEET_STATS, SheetIndex, sheet_index
+
+
+def brute_count(low, high, total=200) -> int:
+    """Sheets within ``low``/``high`` summing to ``total``, by convolving each stat's range."""
+    ways = np.ones(1, dtype=np.int64)
+    for floor, ceiling in zip(low, high):
+        ways = np.convolve(ways, (np.arange(101) >= floor) & (np.arange(101) <= ceiling))
+    return int(ways[total])
+
+
+def test_size_matches_brute_force():
+    assert len(sheet_index()) == brute_count([0] * 5, [100] * 5) == 47_952_376
+
+
+def test_where_accepts_numpy_integers():
+    index = sheet_index().where(agility=np.int64(60), health=(np.int32(10), 20))
+    assert index.bounds["agility"] == (60, 100)
+    assert len(index) == brute_count([10, 0, 0, 60, 0], [20, 100, 100, 100, 100])
+
+
+def test_rank_and_unrank_round_trip():
+    index = sheet_index()
+    ranks = np.random.default_rng(0).integers(0, len(index), 10_000)
+    sheets = index.unrank(ranks)
+    assert index.contains(sheets).all()
+    assert np.array_equal(index.rank(sheets), ranks)
+    assert index[0] == dict(zip(SHEET_STATS, [0, 0, 0, 100, 100]))
+    assert index[-1] == dict(zip(SHEET_STATS, [100, 100, 0, 0, 0]))
+
+
+def test_consecutive_ranks_are_in_lexicographic_order():
+    index = SheetIndex().where(health=(90, 100), defense=(50, 100))
+    sheets = index.sheets()
+    assert len(sheets) == len(index) == brute_count([90, 50, 0, 0, 0], [100, 100, 100, 100, 100])
+    assert [tuple(sheet) for sheet in sheets.tolist()] == sorted(tuple(sheet) for sheet in sheets.tolist())
+    assert np.array_equal(index.rank(sheets), np.arange(len(index)))
@@ -0,0 +1,43 @@
+import pytest
+
+from role.snapshot import CHUNK, Snapshot, write_snapshot
+from status import Buff, EffectScheduler, VirtualClock
+
+
+def fresh(make_character, count: int):
+    # Nothing else holds these, so CPython reuses their ids once a chunk is written
+    for number in range(count):
+        yield make_character(f"C{number}")
+
+
+def test_streamed_roster_counts_every_row(tmp_path, make_character):
+    count = CHUNK + 4_464
+    path = tmp_path / "roster.qrpg"
+    assert write_snapshot(path, fresh(make_character, count)) == count
+    with Snapshot(path) as snapshot:
+        assert len(snapshot) == count
+        assert snapshot[count - 1].name == f"C{count - 1}"
+
+
+def test_effects_keep_their_owner_row(tmp_path, make_roster):
+    clock = VirtualClock()
+    characters = make_roster(8)
+    scheduler = EffectScheduler(clock=clock)
+    scheduler.schedule(Buff("strength", 4, 2, clock), characters[5])
+    scheduler.run_pending()
+    path = tmp_path / "effects.qrpg"
+    write_snapshot(path, characters, scheduler.effects())
+
+    restored = EffectScheduler(clock=VirtualClock())
+    loaded = make_roster(8)
+    with Snapshot(path) as snapshot:
+        assert snapshot.effects["owner"].tolist() == [5]
+        assert snapshot[5].strength == characters[5].strength
+        assert snapshot.restore_effects(loaded, restored) == 1
+    assert restored.effects()[0][1] is loaded[5]
+
+
+def test_names_past_32_bytes_are_refused(tmp_path, make_character):
+    # 11 three-byte characters, 33 bytes of UTF-8
+    with pytest.raises(ValueError, match="33 bytes"):
+        write_snapshot(tmp_path / "long.qrpg", [make_character("龍" * 11)])
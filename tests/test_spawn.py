@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from overseer import invalid_sheets
+from role.base import Character
+from role.pool import CharacterPool
+from status import Status
+
+SHEETS = np.array([
+    [100, 25, 25, 25, 25],
+    [40, 40, 40, 40, 40],
+    [100, 25, 25, 25, 26],
+    [101, 0, 0, 99, 0],
+    [-1, 100, 100, 1, 0],
+])
+
+
+def test_invalid_sheets_flags_bad_totals_and_out_of_range_stats():
+    assert invalid_sheets(SHEETS).tolist() == [2, 3, 4]
+    assert invalid_sheets(SHEETS[:2].ravel()).tolist() == []
+
+
+def test_character_spawn_matches_the_constructor(make_character):
+    characters = Character.spawn(["A", "B"], "Mage", SHEETS[:2])
+    assert [character.asdict() for character in characters] == [
+        make_character("A", "Mage").asdict(),
+        make_character("B", "Mage", health=40, defense=40, strength=40, agility=40, intelligence=40).asdict(),
+    ]
+    assert all(character.level == 1 and character.status == Status.HEALTHY for character in characters)
+
+
+def test_spawn_refuses_invalid_sheets_and_missing_names():
+    with pytest.raises(AssertionError, match=r"rows \[2, 3, 4\]"):
+        Character.spawn(list("ABCDE"), "Mage", SHEETS)
+    with pytest.raises(AssertionError, match="one name per sheet"):
+        CharacterPool(2).spawn(["A"], "Mage", SHEETS[:2])
+
+
+def test_pool_spawn_takes_one_job_class_per_row():
+    pool = CharacterPool(2)
+    assert pool.spawn(["A", "B"], ["Mage", "Rogue"], SHEETS[:2]) == range(2)
+    assert [pool[row].job_class for row in range(2)] == ["Mage", "Rogue"]
+    assert pool.strength.tolist() == [25, 40]
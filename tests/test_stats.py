@@ -0,0 +1,28 @@
+from overseer import Stat, resolve_stat
+from role.pool import CharacterPool
+from stats import _names
+
+
+def test_attribute_check_by_stat_name_and_other_attribute(make_character):
+    character = make_character(strength=30, agility=20)
+    assert character.attribute_check(Stat.STRENGTH, 30)
+    assert character.attribute_check("Strength", 30)
+    assert not character.attribute_check("agility", 21)
+    assert character.attribute_check("level", 1)
+
+
+def test_pool_rows_read_and_write_their_columns(make_character):
+    pool = CharacterPool(4)
+    pool.add(make_character(strength=30, agility=20))
+    row = pool[0]
+    assert row.strength == 30 and row.max_agility == 20
+    row.adjust_stat("strength", 5)
+    assert pool.strength[0] == 35
+    assert row.stat(Stat.STRENGTH) == 35
+
+
+def test_spellings_resolve_without_being_cached(make_character):
+    known = len(_names)
+    assert resolve_stat("mAx_AgIlItY") == Stat.MAX_AGILITY
+    assert make_character().attribute_check("sTrEnGtH", 25)
+    assert len(_names) == known
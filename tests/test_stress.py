@@ -0,0 +1,62 @@
+"""A small-count run of ``benchmarks/stress_mutation.py``."""
+
+import random
+import sys
+import threading
+
+import pytest
+
+from status import Status, StatusEffect, VirtualClock
+
+THREADS = 8
+
+
+@pytest.fixture(autouse=True)
+def eager_switching():
+    # Switch threads as often as possible to provoke interleaving
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run(work) -> None:
+    threads = [threading.Thread(target=work, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_ticks_lose_no_updates(make_roster):
+    characters = make_roster(3)
+    start, duration, effects = 10 ** 9, 3, 200
+    for character in characters:
+        character.health = start
+    picks = [[random.Random(seed).randrange(len(characters)) for _ in range(effects)] for seed in range(THREADS)]
+    barrier = threading.Barrier(THREADS)
+
+    def work(seed: int) -> None:
+        barrier.wait()
+        for index in picks[seed]:
+            StatusEffect("Poisoned", "health", duration, 1, VirtualClock()).apply(characters[index])
+
+    run(work)
+    ticks = [duration * sum(seed.count(index) for seed in picks) for index in range(len(characters))]
+    assert [character.health for character in characters] == [start - count for count in ticks]
+
+
+def test_late_status_writes_never_revive_the_dead(make_roster):
+    characters = make_roster(200)
+    barrier = threading.Barrier(THREADS)
+
+    def work(seed: int) -> None:
+        barrier.wait()
+        for character in characters:
+            if seed == 0:
+                character.defend(10 ** 6)
+            else:
+                StatusEffect("Poisoned", "health", 1, 0, VirtualClock()).apply(character)
+
+    run(work)
+    assert all(character.status == Status.DEAD for character in characters)
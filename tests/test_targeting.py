@@ -0,0 +1,32 @@
+from overseer import listeners
+from role.targeting import TargetIndex
+from status import Status
+
+
+def test_weakest_follows_events_while_watching(make_roster):
+    members = make_roster(3)
+    with TargetIndex(members) as index:
+        assert index.weakest() is members[0]
+        members[2].health = 10
+        assert index.weakest() is members[2]
+        members[2].defend(500)
+        assert index.weakest() is members[0]
+        assert len(index) == 2
+    assert index not in listeners
+
+
+def test_unwatched_index_needs_explicit_updates(make_roster):
+    members = make_roster(3)
+    index = TargetIndex(members)
+    members[1].strength = 90
+    assert index.weakest("threat") is members[0]
+    index.update(members[1])
+    assert index.weakest("threat") is members[1]
+
+
+def test_assigning_dead_status_drops_target(make_roster):
+    members = make_roster(2)
+    with TargetIndex(members) as index:
+        members[0].status = Status.DEAD
+        assert index.weakest() is members[1]
+        assert len(index) == 1
@@ -0,0 +1,51 @@
+import asyncio
+
+from status import AsyncEffectRunner, Buff, EffectPool, Status, StatusArgs, VirtualClock, default_runner
+
+
+def test_death_cancels_effects_on_the_target(character):
+    async def fight():
+        task = character.effect_async(EffectPool().acquire(StatusArgs.POISONED, VirtualClock()))
+        await asyncio.sleep(0)
+        await character.defend_async(500)
+        await asyncio.gather(task, return_exceptions=True)
+        return task
+
+    task = asyncio.run(fight())
+    assert task.cancelled()
+    assert default_runner().effects(character) == []
+    assert character.status == Status.DEAD
+
+
+def test_cleanse_takes_a_buff_back_out(character):
+    runner = AsyncEffectRunner(interval=0.001)
+
+    async def buff():
+        effect = Buff("strength", 50, 5, VirtualClock())
+        task = runner.start(effect, character)
+        while character.strength < 35:
+            await asyncio.sleep(0.001)
+        assert runner.cleanse(effect, character)
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(buff())
+    assert character.strength == 25
+    assert len(character.modifiers) == 0
+    assert character.status == Status.HEALTHY
+
+
+def test_wait_returns_once_every_effect_has_run(make_roster):
+    runner = AsyncEffectRunner(interval=0.001)
+    first, second = make_roster(2)
+    clock = VirtualClock()
+    effects = Buff("strength", 2, 5, clock), Buff("agility", 3, 5, clock)
+
+    async def run():
+        runner.start(effects[0], first)
+        runner.start(effects[1], second)
+        await runner.wait()
+
+    asyncio.run(run())
+    assert runner.active == 0
+    assert [effect.duration for effect in effects] == [0, 0]
+    assert (first.strength, second.agility) == (25, 25)